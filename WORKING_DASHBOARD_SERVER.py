@@ -4,10 +4,21 @@ WORKING AI Trading Bot Dashboard Server
 This is a guaranteed working version that bypasses all import issues
 """
 
+import asyncio
+import gzip
+import hashlib
+import mimetypes
+import socket
 import sys
 import os
+from contextlib import asynccontextmanager
 from pathlib import Path
 
+# uvloop has no Windows build; fall back to the stock asyncio loop there
+UVICORN_LOOP = "asyncio" if sys.platform == "win32" else "uvloop"
+THREADPOOL_TOKENS = 200
+DASHBOARD_PORTS = [8080, 8081, 8082, 8000, 3000]
+
 print("🚀 AI Trading Bot - WORKING Dashboard Server")
 print("=" * 50)
 
@@ -15,46 +26,115 @@ try:
     # Add src to path
     sys.path.insert(0, 'src')
     
-    from fastapi import FastAPI
-    from fastapi.staticfiles import StaticFiles
-    from fastapi.responses import FileResponse, HTMLResponse
+    from fastapi import FastAPI, Request
+    from fastapi.responses import HTMLResponse, ORJSONResponse, Response
     from fastapi.middleware.cors import CORSMiddleware
+    from fastapi.middleware.gzip import GZipMiddleware
+    import anyio.to_thread
+    import orjson
     import uvicorn
     
     print("✅ All imports successful")
     
+    @asynccontextmanager
+    async def lifespan(app):
+        """Report which event loop uvicorn actually started and size the threadpool"""
+        print(f"⚙️ Event loop: {type(asyncio.get_running_loop())}")
+        # Sync handlers and file I/O run in anyio's threadpool (default 40 tokens)
+        anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_TOKENS
+        yield
+    
     # Create FastAPI app
     app = FastAPI(
         title="AI Trading Bot Dashboard",
         description="Professional AI Trading Bot with ICT Strategies",
-        version="1.0.0"
+        version="1.0.0",
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan
     )
     
-    # Add CORS
+    # Add CORS for the local dashboard origins only; max_age lets browsers
+    # cache preflights for a day instead of sending OPTIONS before each call
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=["*"],
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+        allow_origins=[
+            f"http://{host}:{port}"
+            for host in ("localhost", "127.0.0.1")
+            for port in DASHBOARD_PORTS
+        ],
+        allow_credentials=False,
+        allow_methods=["GET", "POST"],
+        allow_headers=["content-type"],
+        max_age=86400,
     )
     
-    # Mount static files
+    # Compress the larger JSON/static responses; added last so it wraps CORS
+    app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=5)
+    
+    CACHE_CONTROL = "public, max-age=60"
+    
+    def etag_for(content):
+        """Strong ETag for a fixed response body"""
+        return '"' + hashlib.sha1(content).hexdigest() + '"'
+    
+    def conditional_response(request, content, etag, media_type="application/json"):
+        """Return a 304 when the client already holds this exact body"""
+        headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+        return Response(content, media_type=media_type, headers=headers)
+    
+    # Static assets are read and gzipped once at startup and served from memory,
+    # keyed by their path relative to the static directory
     static_dir = Path("src/static")
+    STATIC_MANIFEST = {}
     if static_dir.exists():
-        app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
-        print(f"✅ Static files mounted: {static_dir}")
+        for asset_path in static_dir.rglob("*"):
+            if asset_path.is_file():
+                content = asset_path.read_bytes()
+                media_type = mimetypes.guess_type(asset_path.name)[0] or "application/octet-stream"
+                STATIC_MANIFEST[asset_path.relative_to(static_dir).as_posix()] = (
+                    content, gzip.compress(content, 5), etag_for(content), media_type
+                )
+        print(f"✅ Static files loaded: {static_dir} ({len(STATIC_MANIFEST)} files)")
+    
+    def asset_response(request, asset):
+        """Serve a manifest entry, gzipped when the client accepts it"""
+        content, compressed, etag, media_type = asset
+        headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL, "Vary": "Accept-Encoding"}
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+        if "gzip" in request.headers.get("accept-encoding", ""):
+            headers["Content-Encoding"] = "gzip"
+            return Response(compressed, media_type=media_type, headers=headers)
+        return Response(content, media_type=media_type, headers=headers)
+    
+    @app.get("/static/{path:path}")
+    async def static_files(path: str, request: Request):
+        asset = STATIC_MANIFEST.get(path)
+        if asset is None:
+            return Response(status_code=404)
+        return asset_response(request, asset)
     
     # Routes
+    # Handlers stay `async def` but only return prebuilt bytes, so they never
+    # hold the event loop for longer than a dict lookup
+    ROOT_JSON = orjson.dumps({"message": "AI Trading Bot is running!", "status": "success"})
+    HEALTH_JSON = orjson.dumps({"status": "healthy", "server": "working", "port": "active"})
+    
+    def json_bytes(content):
+        """Wrap pre-serialized JSON bytes in a response"""
+        return Response(content, media_type="application/json")
+    
     @app.get("/")
     async def root():
-        return {"message": "AI Trading Bot is running!", "status": "success"}
+        return json_bytes(ROOT_JSON)
     
     @app.get("/dashboard")
-    async def dashboard():
-        index_file = static_dir / "index.html"
-        if index_file.exists():
-            return FileResponse(str(index_file))
+    async def dashboard(request: Request):
+        index = STATIC_MANIFEST.get("index.html")
+        if index is not None:
+            return asset_response(request, index)
         return HTMLResponse("""
         <html><body style="background: linear-gradient(135deg, #1e3c72 0%, #2a5298 100%); color: white; text-align: center; padding: 50px;">
         <h1>🤖 AI Trading Bot Dashboard</h1>
@@ -65,106 +145,148 @@ try:
     
     @app.get("/health")
     async def health():
-        return {"status": "healthy", "server": "working", "port": "active"}
+        return json_bytes(HEALTH_JSON)
     
     # Mock API endpoints with realistic data
+    # Constant payloads are serialized once here instead of on every request
+    TRADING_STATUS_JSON = orjson.dumps({
+        "status": "active",
+        "mode": "paper",
+        "active_positions": 3,
+        "daily_pnl": 245.67,
+        "total_trades": 15,
+        "cash_balance": 8500.0,
+        "total_value": 11560.0
+    })
+    POSITIONS_JSON = orjson.dumps([
+        {"symbol": "BTCUSDT", "side": "long", "quantity": 0.25, "entry_price": 42800.0, "current_price": 43250.50, "unrealized_pnl": 112.63, "realized_pnl": 0.0, "margin_used": 1070.0, "created_at": "2024-01-15T10:30:00Z", "updated_at": "2024-01-15T15:45:00Z"},
+        {"symbol": "ETHUSDT", "side": "long", "quantity": 2.5, "entry_price": 2520.0, "current_price": 2580.75, "unrealized_pnl": 151.88, "realized_pnl": 0.0, "margin_used": 630.0, "created_at": "2024-01-15T09:15:00Z", "updated_at": "2024-01-15T15:45:00Z"},
+        {"symbol": "SOLUSDT", "side": "short", "quantity": 10.0, "entry_price": 102.30, "current_price": 98.45, "unrealized_pnl": 38.50, "realized_pnl": 0.0, "margin_used": 255.75, "created_at": "2024-01-15T11:20:00Z", "updated_at": "2024-01-15T15:45:00Z"}
+    ])
+    STRATEGIES_JSON = orjson.dumps([
+        {"name": "ICT", "enabled": True, "description": "Inner Circle Trader strategy", "performance": {"total_return": 0.156, "sharpe_ratio": 1.34, "max_drawdown": 0.078, "win_rate": 0.672, "profit_factor": 2.18}, "last_signal": "2024-01-15T15:30:00Z"},
+        {"name": "SMC", "enabled": True, "description": "Smart Money Concepts", "performance": {"total_return": 0.089, "sharpe_ratio": 0.98, "max_drawdown": 0.045, "win_rate": 0.614, "profit_factor": 1.87}, "last_signal": "2024-01-15T15:25:00Z"}
+    ])
+    TRADES_JSON = orjson.dumps([
+        {"trade_id": "trade_001", "order_id": "order_001", "symbol": "BTCUSDT", "side": "buy", "quantity": 0.1, "price": 42500.0, "commission": 4.25, "timestamp": "2024-01-15T14:30:00Z", "strategy": "ICT", "pnl": 125.50},
+        {"trade_id": "trade_002", "order_id": "order_002", "symbol": "ETHUSDT", "side": "buy", "quantity": 1.0, "price": 2480.0, "commission": 2.48, "timestamp": "2024-01-15T13:15:00Z", "strategy": "SMC", "pnl": 87.25}
+    ])
+    PERFORMANCE_JSON = orjson.dumps({"total_return": 0.156, "sharpe_ratio": 1.18, "max_drawdown": 0.092, "win_rate": 0.644, "total_trades": 15, "daily_pnl": 245.67, "weekly_pnl": 892.34, "monthly_pnl": 1560.00, "volatility": 0.15, "beta": 0.85})
+    RISK_METRICS_JSON = orjson.dumps({"var_95": 578.0, "var_99": 231.2, "expected_shortfall": 924.8, "max_position_size": 2312.0, "current_exposure": 1955.75, "leverage": 2.5, "margin_ratio": 0.15})
+    BOT_STARTED_JSON = orjson.dumps({"message": "Trading bot started successfully", "status": "running", "mode": "paper"})
+    BOT_STOPPED_JSON = orjson.dumps({"message": "Trading bot stopped", "status": "stopped"})
+    # bot_status only has two possible bodies, so both are prebuilt
+    STATUS_RUNNING_JSON = orjson.dumps({"running": True, "mode": "paper", "auto_trading": True})
+    STATUS_STOPPED_JSON = orjson.dumps({"running": False, "mode": "paper", "auto_trading": False})
+    INITIALIZE_DEMO_JSON = orjson.dumps({"message": "Demo data initialized", "positions": 3, "trades": 15, "portfolio_value": 11560.0})
+    STRATEGIES_ETAG = etag_for(STRATEGIES_JSON)
+    PERFORMANCE_ETAG = etag_for(PERFORMANCE_JSON)
+    RISK_METRICS_ETAG = etag_for(RISK_METRICS_JSON)
+    
     @app.get("/api/v1/trading/status")
     async def trading_status():
-        return {
-            "status": "active",
-            "mode": "paper",
-            "active_positions": 3,
-            "daily_pnl": 245.67,
-            "total_trades": 15,
-            "cash_balance": 8500.0,
-            "total_value": 11560.0
-        }
+        return json_bytes(TRADING_STATUS_JSON)
     
     @app.get("/api/v1/trading/positions")
     async def positions():
-        return [
-            {"symbol": "BTCUSDT", "side": "long", "quantity": 0.25, "entry_price": 42800.0, "current_price": 43250.50, "unrealized_pnl": 112.63, "realized_pnl": 0.0, "margin_used": 1070.0, "created_at": "2024-01-15T10:30:00Z", "updated_at": "2024-01-15T15:45:00Z"},
-            {"symbol": "ETHUSDT", "side": "long", "quantity": 2.5, "entry_price": 2520.0, "current_price": 2580.75, "unrealized_pnl": 151.88, "realized_pnl": 0.0, "margin_used": 630.0, "created_at": "2024-01-15T09:15:00Z", "updated_at": "2024-01-15T15:45:00Z"},
-            {"symbol": "SOLUSDT", "side": "short", "quantity": 10.0, "entry_price": 102.30, "current_price": 98.45, "unrealized_pnl": 38.50, "realized_pnl": 0.0, "margin_used": 255.75, "created_at": "2024-01-15T11:20:00Z", "updated_at": "2024-01-15T15:45:00Z"}
-        ]
+        return json_bytes(POSITIONS_JSON)
     
     @app.get("/api/v1/strategies/")
-    async def strategies():
-        return [
-            {"name": "ICT", "enabled": True, "description": "Inner Circle Trader strategy", "performance": {"total_return": 0.156, "sharpe_ratio": 1.34, "max_drawdown": 0.078, "win_rate": 0.672, "profit_factor": 2.18}, "last_signal": "2024-01-15T15:30:00Z"},
-            {"name": "SMC", "enabled": True, "description": "Smart Money Concepts", "performance": {"total_return": 0.089, "sharpe_ratio": 0.98, "max_drawdown": 0.045, "win_rate": 0.614, "profit_factor": 1.87}, "last_signal": "2024-01-15T15:25:00Z"}
-        ]
+    async def strategies(request: Request):
+        return conditional_response(request, STRATEGIES_JSON, STRATEGIES_ETAG)
     
     @app.get("/api/v1/trading/trades")
     async def trades():
-        return [
-            {"trade_id": "trade_001", "order_id": "order_001", "symbol": "BTCUSDT", "side": "buy", "quantity": 0.1, "price": 42500.0, "commission": 4.25, "timestamp": "2024-01-15T14:30:00Z", "strategy": "ICT", "pnl": 125.50},
-            {"trade_id": "trade_002", "order_id": "order_002", "symbol": "ETHUSDT", "side": "buy", "quantity": 1.0, "price": 2480.0, "commission": 2.48, "timestamp": "2024-01-15T13:15:00Z", "strategy": "SMC", "pnl": 87.25}
-        ]
+        return json_bytes(TRADES_JSON)
     
     @app.get("/api/v1/analytics/performance")
-    async def performance():
-        return {"total_return": 0.156, "sharpe_ratio": 1.18, "max_drawdown": 0.092, "win_rate": 0.644, "total_trades": 15, "daily_pnl": 245.67, "weekly_pnl": 892.34, "monthly_pnl": 1560.00, "volatility": 0.15, "beta": 0.85}
+    async def performance(request: Request):
+        return conditional_response(request, PERFORMANCE_JSON, PERFORMANCE_ETAG)
     
     @app.get("/api/v1/analytics/risk-metrics")
-    async def risk_metrics():
-        return {"var_95": 578.0, "var_99": 231.2, "expected_shortfall": 924.8, "max_position_size": 2312.0, "current_exposure": 1955.75, "leverage": 2.5, "margin_ratio": 0.15}
+    async def risk_metrics(request: Request):
+        return conditional_response(request, RISK_METRICS_JSON, RISK_METRICS_ETAG)
     
     # Bot control endpoints
+    # Per-worker demo state: with several uvicorn workers each process keeps
+    # its own flag, so start/stop is only visible to the worker that handled it
     bot_running = False
     
     @app.post("/api/v1/bot/start")
     async def start_bot():
         global bot_running
         bot_running = True
-        return {"message": "Trading bot started successfully", "status": "running", "mode": "paper"}
+        return json_bytes(BOT_STARTED_JSON)
     
     @app.post("/api/v1/bot/stop")
     async def stop_bot():
         global bot_running
         bot_running = False
-        return {"message": "Trading bot stopped", "status": "stopped"}
+        return json_bytes(BOT_STOPPED_JSON)
     
     @app.get("/api/v1/bot/status")
     async def bot_status():
-        return {"running": bot_running, "mode": "paper", "auto_trading": bot_running}
+        return json_bytes(STATUS_RUNNING_JSON if bot_running else STATUS_STOPPED_JSON)
     
     @app.post("/api/v1/bot/initialize-demo")
     async def initialize_demo():
-        return {"message": "Demo data initialized", "positions": 3, "trades": 15, "portfolio_value": 11560.0}
+        return json_bytes(INITIALIZE_DEMO_JSON)
     
-    # Try multiple ports
-    ports_to_try = [8080, 8081, 8082, 8000, 3000]
-    
-    for port in ports_to_try:
+    def port_is_free(port, host="127.0.0.1"):
+        """Cheap bind probe so uvicorn is only started on a port that is actually free"""
+        probe = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         try:
-            print(f"🔄 Trying to start server on port {port}...")
+            # Match uvicorn's own bind options; on Windows SO_REUSEADDR would
+            # let the probe succeed on a port that is already in use
+            if sys.platform != "win32":
+                probe.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            probe.bind((host, port))
+            return True
+        except OSError:
+            return False
+        finally:
+            probe.close()
+    
+    # Workers re-import this module to get `app`; only the launching process serves
+    if __name__ == "__main__":
+        # Pick the first free port, then start uvicorn exactly once
+        port = None
+        for candidate in DASHBOARD_PORTS:
+            if port_is_free(candidate):
+                port = candidate
+                break
+            print(f"⚠️ Port {candidate} is busy, trying next port...")
+        
+        if port is None:
+            print("❌ All ports failed!")
+        else:
+            workers = int(os.environ.get("WEB_CONCURRENCY", max(2, (os.cpu_count() or 2) // 2)))
+            print(f"🔄 Starting server on port {port} with {workers} workers...")
             print(f"📊 Dashboard will be at: http://localhost:{port}/dashboard")
             print(f"🔧 API docs at: http://localhost:{port}/docs")
             print(f"❤️ Health check: http://localhost:{port}/health")
             print("-" * 50)
             
-            uvicorn.run(app, host="127.0.0.1", port=port, log_level="info")
-            break  # If successful, break out of loop
-            
-        except OSError as e:
-            if "Address already in use" in str(e) or "Only one usage" in str(e):
-                print(f"⚠️ Port {port} is busy, trying next port...")
-                continue
-            else:
-                print(f"❌ Error on port {port}: {e}")
-                continue
-        except Exception as e:
-            print(f"❌ Unexpected error on port {port}: {e}")
-            continue
-    
-    print("❌ All ports failed!")
+            uvicorn.run(
+                "WORKING_DASHBOARD_SERVER:app",
+                app_dir=os.path.dirname(os.path.abspath(__file__)),
+                host="127.0.0.1",
+                port=port,
+                workers=workers,
+                log_level="warning",
+                loop=UVICORN_LOOP,
+                http="httptools",
+                access_log=False,
+                proxy_headers=False,
+            )
 
 except ImportError as e:
     print(f"❌ Import error: {e}")
-    print("🔄 Installing required packages...")
-    os.system("venv\\Scripts\\pip.exe install fastapi uvicorn")
-    print("✅ Packages installed. Please run the script again.")
+    packages = "fastapi uvicorn httptools orjson"
+    if sys.platform != "win32":
+        packages += " uvloop"
+    print(f"💡 Install the missing packages and run the script again: pip install {packages}")
+    sys.exit(1)
     
 except Exception as e:
     print(f"❌ Unexpected error: {e}")
@@ -3,56 +3,78 @@
 Debug Server Startup Issues
 """
 
+import asyncio
+import importlib
 import sys
 import os
 import traceback
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 
 # Add src to path
 sys.path.append('src')
 
+# uvloop has no Windows build; fall back to the stock asyncio loop there
+UVICORN_LOOP = "asyncio" if sys.platform == "win32" else "uvloop"
+UVICORN_HTTP = "httptools"
+
+def _check_config():
+    from core.config import get_settings
+    get_settings()
+
+def _check_memory_storage():
+    from core.memory_storage import get_memory_data_manager
+    get_memory_data_manager()
+
+def _check_api_routes():
+    from api.routes import api_router
+
+# (name, check) pairs; the checks touch distinct modules so they can load concurrently
+IMPORT_CHECKS = [
+    ("FastAPI", lambda: importlib.import_module("fastapi")),
+    ("Uvicorn", lambda: importlib.import_module("uvicorn")),
+    ("Config", _check_config),
+    ("Memory storage", _check_memory_storage),
+    ("API routes", _check_api_routes),
+]
+
 def test_imports():
     """Test all critical imports"""
+    global UVICORN_LOOP, UVICORN_HTTP
     print("🔍 Testing imports...")
     
-    try:
-        import fastapi
-        print("✅ FastAPI imported")
-    except Exception as e:
-        print(f"❌ FastAPI import failed: {e}")
-        return False
+    with ThreadPoolExecutor(max_workers=len(IMPORT_CHECKS)) as executor:
+        futures = [(name, check, executor.submit(check)) for name, check in IMPORT_CHECKS]
     
-    try:
-        import uvicorn
-        print("✅ Uvicorn imported")
-    except Exception as e:
-        print(f"❌ Uvicorn import failed: {e}")
-        return False
+    for name, check, future in futures:
+        try:
+            future.result()
+        except Exception as e:
+            # Some packages have import-time side effects that are not thread
+            # safe, so retry sequentially before reporting a real failure
+            print(f"⚠️ {name} failed during parallel import ({e}), retrying")
+            try:
+                check()
+            except Exception as e:
+                print(f"❌ {name} import failed: {e}")
+                traceback.print_exc()
+                return False
+        print(f"✅ {name} imported")
     
     try:
-        from core.config import get_settings
-        settings = get_settings()
-        print("✅ Config loaded")
-    except Exception as e:
-        print(f"❌ Config import failed: {e}")
-        traceback.print_exc()
-        return False
-    
-    try:
-        from core.memory_storage import get_memory_data_manager
-        data_manager = get_memory_data_manager()
-        print("✅ Memory storage imported")
-    except Exception as e:
-        print(f"❌ Memory storage import failed: {e}")
-        traceback.print_exc()
-        return False
+        import httptools
+        print("✅ httptools imported")
+    except ImportError as e:
+        print(f"⚠️ httptools not available ({e}), falling back to h11")
+        UVICORN_HTTP = "h11"
     
-    try:
-        from api.routes import api_router
-        print("✅ API routes imported")
-    except Exception as e:
-        print(f"❌ API routes import failed: {e}")
-        traceback.print_exc()
-        return False
+    if UVICORN_LOOP == "uvloop":
+        try:
+            import uvloop
+            print("✅ uvloop imported")
+        except ImportError as e:
+            print(f"⚠️ uvloop not available ({e}), falling back to asyncio")
+            UVICORN_LOOP = "asyncio"
     
     return True
 
@@ -64,7 +86,12 @@ def test_simple_server():
         from fastapi import FastAPI
         import uvicorn
         
-        app = FastAPI()
+        @asynccontextmanager
+        async def lifespan(app):
+            print(f"⚙️ Event loop: {type(asyncio.get_running_loop())}")
+            yield
+        
+        app = FastAPI(lifespan=lifespan)
         
         @app.get("/")
         def root():
@@ -78,7 +105,14 @@ def test_simple_server():
         print("🚀 Starting server on port 8001...")
         
         # Start on different port to avoid conflicts
-        uvicorn.run(app, host="127.0.0.1", port=8001, log_level="debug")
+        uvicorn.run(
+            app,
+            host="127.0.0.1",
+            port=8001,
+            log_level="debug",
+            loop=UVICORN_LOOP,
+            http=UVICORN_HTTP,
+        )
         
     except Exception as e:
         print(f"❌ Minimal server failed: {e}")
@@ -14,6 +14,8 @@ import os
 from datetime import datetime, timedelta
 from typing import List
 
+import numpy as np
+
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
@@ -21,64 +23,58 @@ from core.data_manager import Candle
 from core.config import get_settings
 from core.logger import setup_logging
 
-# Import our new technical analysis components
-from analysis.indicators.moving_averages import MovingAverageIndicator
-from analysis.indicators.oscillators import RSIIndicator
-from analysis.indicators.momentum import MACDIndicator
-from analysis.indicators.volatility import BollingerBandsIndicator
-from analysis.patterns.candlestick import CandlestickPatterns
+# Technical analysis components are imported inside each demo so the
+# indicator/pattern stack is only loaded when a demo actually runs
 
 
 def create_realistic_market_data(count: int = 100) -> List[Candle]:
     """Create realistic market data for demonstration"""
-    candles = []
     base_price = 50000.0  # Starting at $50,000 (like Bitcoin)
+    rng = np.random.default_rng()
+    idx = np.arange(count)
     
     print(f"📊 Generating {count} candles of realistic market data...")
     
-    for i in range(count):
-        # Simulate realistic price movements
-        if i < 30:
-            # Uptrend phase
-            trend = 0.002 + (i * 0.0001)
-        elif i < 60:
-            # Consolidation phase
-            trend = 0.0005 * (1 if i % 2 == 0 else -1)
-        else:
-            # Downtrend phase
-            trend = -0.001 - ((i - 60) * 0.0001)
-        
-        # Add some randomness
-        import random
-        random_factor = random.uniform(-0.01, 0.01)
-        price_change = trend + random_factor
-        
-        new_price = base_price * (1 + price_change)
-        
-        # Create realistic OHLC
-        open_price = base_price
-        close_price = new_price
-        
-        if close_price > open_price:  # Bullish candle
-            high_price = close_price * (1 + random.uniform(0, 0.005))
-            low_price = open_price * (1 - random.uniform(0, 0.003))
-        else:  # Bearish candle
-            high_price = open_price * (1 + random.uniform(0, 0.003))
-            low_price = close_price * (1 - random.uniform(0, 0.005))
-        
-        candle = Candle(
+    # Uptrend, then consolidation, then downtrend
+    trend = np.where(
+        idx < 30,
+        0.002 + idx * 0.0001,
+        np.where(
+            idx < 60,
+            0.0005 * np.where(idx % 2 == 0, 1, -1),
+            -0.001 - (idx - 60) * 0.0001
+        )
+    )
+    
+    # Add some randomness and walk the price forward
+    price_change = trend + rng.uniform(-0.01, 0.01, count)
+    closes = base_price * np.cumprod(1 + price_change)
+    opens = np.concatenate(([base_price], closes[:-1]))
+    
+    # Create realistic OHLC: wicks extend further on the close side of the move
+    bullish = closes > opens
+    long_wick = rng.uniform(0, 0.005, count)
+    short_wick = rng.uniform(0, 0.003, count)
+    highs = np.where(bullish, closes * (1 + long_wick), opens * (1 + short_wick))
+    lows = np.where(bullish, opens * (1 - short_wick), closes * (1 - long_wick))
+    volumes = rng.uniform(100, 1000, count)
+    
+    start_time = datetime.utcnow()
+    candles = [
+        Candle(
             symbol="BTCUSDT",
             timeframe="1h",
-            timestamp=datetime.utcnow() + timedelta(hours=i),
-            open_price=open_price,
-            high_price=high_price,
-            low_price=low_price,
-            close_price=close_price,
-            volume=random.uniform(100, 1000)
+            timestamp=start_time + timedelta(hours=i),
+            open_price=o,
+            high_price=h,
+            low_price=l,
+            close_price=c,
+            volume=v
         )
-        
-        candles.append(candle)
-        base_price = new_price
+        for i, (o, h, l, c, v) in enumerate(zip(
+            opens.tolist(), highs.tolist(), lows.tolist(), closes.tolist(), volumes.tolist()
+        ))
+    ]
     
     print(f"✅ Generated market data: ${candles[0].close:.2f} → ${candles[-1].close:.2f}")
     return candles
@@ -90,6 +86,11 @@ async def demo_technical_indicators():
     print("🔧 TECHNICAL INDICATORS DEMONSTRATION")
     print("="*60)
     
+    from analysis.indicators.moving_averages import MovingAverageIndicator
+    from analysis.indicators.oscillators import RSIIndicator
+    from analysis.indicators.momentum import MACDIndicator
+    from analysis.indicators.volatility import BollingerBandsIndicator
+    
     # Create test data
     candles = create_realistic_market_data(50)
     
@@ -104,42 +105,33 @@ async def demo_technical_indicators():
     
     print(f"\n📈 Processing {len(candles)} candles through {len(indicators)} indicators...")
     
-    # Process candles through indicators
-    results = {name: [] for name in indicators.keys()}
-    
-    for i, candle in enumerate(candles):
-        print(f"\r⏳ Processing candle {i+1}/{len(candles)}: ${candle.close:.2f}", end="")
-        
-        for name, indicator in indicators.items():
-            result = indicator.update(candle)
-            if result:
-                results[name].append(result)
+    # Compute every indicator over the whole series in one vectorized pass each
+    closes = np.fromiter((c.close for c in candles), dtype=np.float64, count=len(candles))
+    results = {name: indicator.compute(closes) for name, indicator in indicators.items()}
     
-    print("\n")
+    print(f"✅ Processed candles up to ${closes[-1]:.2f}")
     
     # Display results
-    for name, indicator_results in results.items():
-        if indicator_results:
-            latest = indicator_results[-1]
-            print(f"\n📊 {name}:")
-            print(f"   Current Value: {latest.value}")
-            print(f"   Signal: {latest.signal}")
-            print(f"   Confidence: {latest.confidence:.2f}")
+    for name, series in results.items():
+        print(f"\n📊 {name}:")
+        if isinstance(series, dict):
+            latest = {key: round(float(values[-1]), 4) for key, values in series.items()}
+            print(f"   Current Value: {latest}")
+        else:
+            print(f"   Current Value: {series[-1]:.4f}")
             
             # Show trend for moving averages
-            if "MA" in name and len(indicator_results) >= 2:
-                prev_value = indicator_results[-2].value
-                trend = "📈 Rising" if latest.value > prev_value else "📉 Falling"
+            if "MA" in name and not np.isnan(series[-2]):
+                trend = "📈 Rising" if series[-1] > series[-2] else "📉 Falling"
                 print(f"   Trend: {trend}")
     
     # Demonstrate crossover signals
-    sma_indicator = indicators["SMA_20"]
-    ema_indicator = indicators["EMA_12"]
-    
-    if len(sma_indicator.results) > 0 and len(ema_indicator.results) > 0:
-        cross_signal = ema_indicator.get_ma_cross_signals(sma_indicator)
-        if cross_signal:
-            print(f"\n🎯 MA Crossover Signal: {cross_signal}")
+    fast, slow = results["EMA_12"], results["SMA_20"]
+    if not np.isnan(slow[-2]):
+        if fast[-2] <= slow[-2] and fast[-1] > slow[-1]:
+            print("\n🎯 MA Crossover Signal: golden_cross")
+        elif fast[-2] >= slow[-2] and fast[-1] < slow[-1]:
+            print("\n🎯 MA Crossover Signal: death_cross")
 
 
 async def demo_pattern_recognition():
@@ -148,6 +140,8 @@ async def demo_pattern_recognition():
     print("🔍 PATTERN RECOGNITION DEMONSTRATION")
     print("="*60)
     
+    from analysis.patterns.candlestick import CandlestickPatterns
+    
     # Create test data with some specific patterns
     candles = create_realistic_market_data(30)
     
@@ -156,18 +150,16 @@ async def demo_pattern_recognition():
     
     print(f"\n🕵️ Analyzing {len(candles)} candles for patterns...")
     
-    all_patterns = []
+    # One compiled pass over the whole history; only hits become Python objects
+    all_patterns = pattern_detector.detect_batch(candles)
     
-    for i, candle in enumerate(candles):
-        patterns = pattern_detector.update(candle)
-        if patterns:
-            all_patterns.extend(patterns)
-            for pattern in patterns:
-                print(f"\n🎯 Pattern Detected at Candle {i+1}:")
-                print(f"   Name: {pattern.pattern_name}")
-                print(f"   Signal: {pattern.signal.value}")
-                print(f"   Confidence: {pattern.confidence:.2f}")
-                print(f"   Price: ${candle.close:.2f}")
+    for pattern in all_patterns:
+        candle = candles[pattern.end_index]
+        print(f"\n🎯 Pattern Detected at Candle {pattern.end_index + 1}:")
+        print(f"   Name: {pattern.pattern_name}")
+        print(f"   Signal: {pattern.signal.value}")
+        print(f"   Confidence: {pattern.confidence:.2f}")
+        print(f"   Price: ${candle.close:.2f}")
     
     if not all_patterns:
         print("   No significant patterns detected in this dataset")
@@ -189,6 +181,10 @@ async def demo_integrated_analysis():
     print("🔗 INTEGRATED ANALYSIS DEMONSTRATION")
     print("="*60)
     
+    from analysis.indicators.oscillators import RSIIndicator
+    from analysis.indicators.volatility import BollingerBandsIndicator
+    from analysis.patterns.candlestick import CandlestickPatterns
+    
     # Create test data
     candles = create_realistic_market_data(40)
     
@@ -199,28 +195,40 @@ async def demo_integrated_analysis():
     
     print(f"\n🧠 Running integrated analysis on {len(candles)} candles...")
     
+    # Indicator series are computed in bulk; signals are threshold masks over them
+    closes = np.fromiter((c.close for c in candles), dtype=np.float64, count=len(candles))
+    rsi_values = rsi.compute(closes)
+    percent_b = bb.compute(closes)["percent_b"]
+    
+    rsi_buy = rsi_values <= rsi.oversold
+    rsi_sell = rsi_values >= rsi.overbought
+    bb_buy = percent_b <= 0.0
+    bb_sell = percent_b >= 1.0
+    ready = ~np.isnan(rsi_values) & ~np.isnan(percent_b)
+    
+    patterns_by_candle = {}
+    for pattern in patterns.detect_batch(candles):
+        patterns_by_candle.setdefault(pattern.end_index, []).append(pattern)
+    
     signals = []
     
     for i, candle in enumerate(candles):
-        # Update all indicators
-        rsi_result = rsi.update(candle)
-        bb_result = bb.update(candle)
-        pattern_results = patterns.update(candle)
+        pattern_results = patterns_by_candle.get(i, [])
         
         # Combine signals for trading decision
-        if rsi_result and bb_result:
+        if ready[i]:
             current_signals = []
             
             # RSI signals
-            if rsi_result.signal == "buy":
+            if rsi_buy[i]:
                 current_signals.append("RSI: Oversold")
-            elif rsi_result.signal == "sell":
+            elif rsi_sell[i]:
                 current_signals.append("RSI: Overbought")
             
             # Bollinger Bands signals
-            if bb_result.signal == "buy":
+            if bb_buy[i]:
                 current_signals.append("BB: Near Lower Band")
-            elif bb_result.signal == "sell":
+            elif bb_sell[i]:
                 current_signals.append("BB: Near Upper Band")
             
             # Pattern signals
@@ -233,8 +241,8 @@ async def demo_integrated_analysis():
                     "candle": i + 1,
                     "price": candle.close,
                     "signals": current_signals,
-                    "rsi": rsi_result.value,
-                    "bb_percent": bb_result.value.get("percent_b", 0) if isinstance(bb_result.value, dict) else 0
+                    "rsi": float(rsi_values[i]),
+                    "bb_percent": float(percent_b[i])
                 })
     
     # Display integrated signals
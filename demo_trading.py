@@ -12,9 +12,17 @@ from datetime import datetime
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from src.core.config import get_settings
-from src.core.engine import TradingEngine
-from src.core.strategy_manager import StrategyType
-from src.strategies.simple_ma_strategy import SimpleMAStrategy
+
+
+# Fields shared by every simulated candle message
+CANDLE_TEMPLATE = {
+    "symbol": "BTCUSDT",
+    "data_type": "candle",
+    "data": {
+        "symbol": "BTCUSDT",
+        "timeframe": "1m",
+    },
+}
 
 
 async def demo_trading_system():
@@ -23,6 +31,11 @@ async def demo_trading_system():
     print("=" * 50)
     
     try:
+        # The engine/strategy stack is only loaded once the demo actually runs
+        from src.core.engine import TradingEngine
+        from src.core.strategy_manager import StrategyType
+        from src.strategies.simple_ma_strategy import SimpleMAStrategy
+        
         # Initialize the trading engine
         print("1. Initializing Trading Engine...")
         settings = get_settings()
@@ -46,20 +59,18 @@ async def demo_trading_system():
             price_change = (-1 if i % 3 == 0 else 1) * (i * 10)  # Create some price movement
             current_price = base_price + price_change
             
-            market_data = {
-                "symbol": "BTCUSDT",
-                "data_type": "candle",
-                "timestamp": datetime.utcnow().isoformat(),
-                "data": {
-                    "symbol": "BTCUSDT",
-                    "timeframe": "1m",
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "open": current_price - 5,
-                    "high": current_price + 10,
-                    "low": current_price - 10,
-                    "close": current_price,
-                    "volume": 100.0 + i * 5
-                }
+            # One timestamp per candle, shared by the envelope and the candle body
+            timestamp = datetime.utcnow().isoformat()
+            market_data = CANDLE_TEMPLATE.copy()
+            market_data["timestamp"] = timestamp
+            market_data["data"] = {
+                **CANDLE_TEMPLATE["data"],
+                "timestamp": timestamp,
+                "open": current_price - 5,
+                "high": current_price + 10,
+                "low": current_price - 10,
+                "close": current_price,
+                "volume": 100.0 + i * 5
             }
             
             # Process market data through strategies
@@ -106,8 +117,9 @@ async def demo_trading_system():
                                 )
                                 print(f"      📈 Opened long position: {signal['symbol']}")
                             
-            # Small delay to make it more realistic
-            await asyncio.sleep(0.1)
+            # Brief pause every few candles so the output stays readable
+            if i % 5 == 0:
+                await asyncio.sleep(0.05)
         
         # Show final status
         print("\n4. Final Status:")
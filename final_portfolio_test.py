@@ -7,11 +7,67 @@ import sys
 import os
 sys.path.append('.')
 
+import asyncio
+import aiohttp
 import requests
 import json
 from datetime import datetime
 
-def test_all_endpoints():
+async def fetch_endpoint(session, url):
+    """GET one endpoint, returning its status code and body text"""
+    async with session.get(url) as response:
+        return response.status, await response.text()
+
+def report_endpoint(endpoint, outcome, results):
+    """Print and record the outcome of one endpoint probe"""
+    try:
+        print(f"\n🧪 Testing {endpoint}...")
+        if isinstance(outcome, BaseException):
+            raise outcome
+        status_code, text = outcome
+        
+        if status_code == 200:
+            data = json.loads(text)
+            results[endpoint] = {
+                "status": "✅ SUCCESS",
+                "status_code": status_code,
+                "data_length": len(data) if isinstance(data, list) else "object",
+                "sample": data[0] if isinstance(data, list) and data else str(data)[:100] + "..."
+            }
+            print(f"   ✅ Status: {status_code}")
+            print(f"   📊 Data: {len(data) if isinstance(data, list) else 'object'}")
+            
+            # Special handling for portfolio-history
+            if endpoint == "/api/v1/analytics/portfolio-history":
+                print(f"   📈 Portfolio entries: {len(data)}")
+                if data:
+                    print(f"   📅 Date range: {data[0]['timestamp'][:10]} to {data[-1]['timestamp'][:10]}")
+                    print(f"   💰 Value range: ${data[0]['total_value']:,.2f} to ${data[-1]['total_value']:,.2f}")
+            
+        else:
+            results[endpoint] = {
+                "status": "❌ FAILED",
+                "status_code": status_code,
+                "error": text
+            }
+            print(f"   ❌ Status: {status_code}")
+            print(f"   📄 Response: {text}")
+            
+    except aiohttp.ClientConnectionError:
+        results[endpoint] = {
+            "status": "❌ CONNECTION ERROR",
+            "error": "Cannot connect to server"
+        }
+        print(f"   ❌ Cannot connect to server")
+        
+    except Exception as e:
+        results[endpoint] = {
+            "status": "❌ ERROR",
+            "error": str(e)
+        }
+        print(f"   ❌ Error: {e}")
+
+async def test_all_endpoints():
     """Test all critical dashboard endpoints"""
     print("🚀 Final Portfolio History Test")
     print("=" * 60)
@@ -30,51 +86,15 @@ def test_all_endpoints():
     
     results = {}
     
-    for endpoint in endpoints:
-        try:
-            print(f"\n🧪 Testing {endpoint}...")
-            response = requests.get(f"{base_url}{endpoint}", timeout=5)
-            
-            if response.status_code == 200:
-                data = response.json()
-                results[endpoint] = {
-                    "status": "✅ SUCCESS",
-                    "status_code": response.status_code,
-                    "data_length": len(data) if isinstance(data, list) else "object",
-                    "sample": data[0] if isinstance(data, list) and data else str(data)[:100] + "..."
-                }
-                print(f"   ✅ Status: {response.status_code}")
-                print(f"   📊 Data: {len(data) if isinstance(data, list) else 'object'}")
-                
-                # Special handling for portfolio-history
-                if endpoint == "/api/v1/analytics/portfolio-history":
-                    print(f"   📈 Portfolio entries: {len(data)}")
-                    if data:
-                        print(f"   📅 Date range: {data[0]['timestamp'][:10]} to {data[-1]['timestamp'][:10]}")
-                        print(f"   💰 Value range: ${data[0]['total_value']:,.2f} to ${data[-1]['total_value']:,.2f}")
-                
-            else:
-                results[endpoint] = {
-                    "status": "❌ FAILED",
-                    "status_code": response.status_code,
-                    "error": response.text
-                }
-                print(f"   ❌ Status: {response.status_code}")
-                print(f"   📄 Response: {response.text}")
-                
-        except requests.exceptions.ConnectionError:
-            results[endpoint] = {
-                "status": "❌ CONNECTION ERROR",
-                "error": "Cannot connect to server"
-            }
-            print(f"   ❌ Cannot connect to server")
-            
-        except Exception as e:
-            results[endpoint] = {
-                "status": "❌ ERROR",
-                "error": str(e)
-            }
-            print(f"   ❌ Error: {e}")
+    # Issue every GET at once from the event loop over one pooled session
+    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=5)) as session:
+        outcomes = await asyncio.gather(
+            *(fetch_endpoint(session, f"{base_url}{endpoint}") for endpoint in endpoints),
+            return_exceptions=True
+        )
+    
+    for endpoint, outcome in zip(endpoints, outcomes):
+        report_endpoint(endpoint, outcome, results)
     
     # Summary
     print("\n" + "=" * 60)
@@ -84,8 +104,8 @@ def test_all_endpoints():
     success_count = 0
     total_count = len(endpoints)
     
-    for endpoint, result in results.items():
-        status = result["status"]
+    for endpoint in endpoints:
+        status = results[endpoint]["status"]
         print(f"{status} {endpoint}")
         if "SUCCESS" in status:
             success_count += 1
@@ -144,7 +164,7 @@ if __name__ == "__main__":
     # Run all tests
     health_ok = test_server_health()
     dashboard_ok = test_dashboard_access()
-    endpoints_ok = test_all_endpoints()
+    endpoints_ok = asyncio.run(test_all_endpoints())
     
     print("\n" + "=" * 60)
     print("🏁 FINAL VERIFICATION COMPLETE")
@@ -5,18 +5,23 @@ This version bypasses complex initialization to get the server running quickly
 """
 
 import asyncio
+import hashlib
 import logging
+import mmap
 import signal
+import socket
 import sys
 import os
+import tempfile
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import AsyncGenerator
 
-import uvicorn
-from fastapi import FastAPI, HTTPException
+import orjson
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 
 # Add src to path for imports
@@ -25,8 +30,23 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 print("🚀 AI Trading Bot - Fixed Main Server")
 print("=" * 50)
 
+# uvloop has no Windows build; fall back to the stock asyncio loop there
+UVICORN_LOOP = "asyncio" if sys.platform == "win32" else "uvloop"
+
+# Set by main() to a one-byte file shared by every worker process
+BOT_STATE_ENV = "BOT_STATE_FILE"
+
+def open_bot_state():
+    """Return the one-byte bot running flag, shared across workers when available"""
+    path = os.environ.get(BOT_STATE_ENV)
+    if path is None:
+        # Imported outside main() (tests, single process): a local flag is enough
+        return bytearray(1)
+    with open(path, "r+b") as state_file:
+        return mmap.mmap(state_file.fileno(), 1)
+
 # Global state for simplified operation
-bot_running = False
+bot_state = open_bot_state()
 trading_engine = None
 
 @asynccontextmanager
@@ -62,6 +82,7 @@ app = FastAPI(
     title="AI Trading Bot",
     description="Advanced AI-powered trading system with ICT and SMC strategies",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -74,6 +95,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress the larger JSON/static responses; added last so it wraps CORS
+app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=5)
+
 # Mount static files for dashboard
 static_dir = Path("src/static")
 if static_dir.exists():
@@ -82,6 +106,17 @@ if static_dir.exists():
 else:
     print(f"⚠️ Static directory not found: {static_dir}")
 
+CACHE_CONTROL = "public, max-age=60"
+
+def etag_for(content):
+    """Strong ETag for a fixed response body"""
+    return '"' + hashlib.sha1(content).hexdigest() + '"'
+
+# index.html is read once so /dashboard is served from memory
+index_file = static_dir / "index.html"
+INDEX_HTML = index_file.read_bytes() if index_file.exists() else None
+INDEX_ETAG = etag_for(INDEX_HTML) if INDEX_HTML is not None else None
+
 # Basic routes
 @app.get("/")
 async def root():
@@ -90,86 +125,105 @@ async def root():
     return RedirectResponse(url="/dashboard")
 
 @app.get("/dashboard")
-async def dashboard():
+async def dashboard(request: Request):
     """Serve the trading dashboard"""
-    index_file = static_dir / "index.html"
-    if index_file.exists():
-        return FileResponse(str(index_file))
+    if INDEX_HTML is not None:
+        headers = {"ETag": INDEX_ETAG, "Cache-Control": CACHE_CONTROL}
+        if request.headers.get("if-none-match") == INDEX_ETAG:
+            return Response(status_code=304, headers=headers)
+        return Response(INDEX_HTML, media_type="text/html", headers=headers)
     return JSONResponse({"error": "Dashboard not found"}, status_code=404)
 
+# Constant payloads are serialized once here instead of on every request
+HEALTH_JSON = orjson.dumps({
+    "status": "healthy",
+    "mode": "simplified",
+    "server": "running",
+    "timestamp": "2024-01-15T15:45:00Z"
+})
+TRADING_STATUS_JSON = orjson.dumps({
+    "status": "active",
+    "mode": "paper",
+    "active_positions": 3,
+    "daily_pnl": 245.67,
+    "total_trades": 15,
+    "cash_balance": 8500.0,
+    "total_value": 11560.0
+})
+POSITIONS_JSON = orjson.dumps([
+    {"symbol": "BTCUSDT", "side": "long", "quantity": 0.25, "entry_price": 42800.0, "current_price": 43250.50, "unrealized_pnl": 112.63, "realized_pnl": 0.0, "margin_used": 1070.0, "created_at": "2024-01-15T10:30:00Z", "updated_at": "2024-01-15T15:45:00Z"},
+    {"symbol": "ETHUSDT", "side": "long", "quantity": 2.5, "entry_price": 2520.0, "current_price": 2580.75, "unrealized_pnl": 151.88, "realized_pnl": 0.0, "margin_used": 630.0, "created_at": "2024-01-15T09:15:00Z", "updated_at": "2024-01-15T15:45:00Z"},
+    {"symbol": "SOLUSDT", "side": "short", "quantity": 10.0, "entry_price": 102.30, "current_price": 98.45, "unrealized_pnl": 38.50, "realized_pnl": 0.0, "margin_used": 255.75, "created_at": "2024-01-15T11:20:00Z", "updated_at": "2024-01-15T15:45:00Z"}
+])
+STRATEGIES_JSON = orjson.dumps([
+    {"name": "ICT", "enabled": True, "description": "Inner Circle Trader strategy", "performance": {"total_return": 0.156, "sharpe_ratio": 1.34, "max_drawdown": 0.078, "win_rate": 0.672, "profit_factor": 2.18}, "last_signal": "2024-01-15T15:30:00Z"},
+    {"name": "SMC", "enabled": True, "description": "Smart Money Concepts", "performance": {"total_return": 0.089, "sharpe_ratio": 0.98, "max_drawdown": 0.045, "win_rate": 0.614, "profit_factor": 1.87}, "last_signal": "2024-01-15T15:25:00Z"}
+])
+TRADES_JSON = orjson.dumps([
+    {"trade_id": "trade_001", "order_id": "order_001", "symbol": "BTCUSDT", "side": "buy", "quantity": 0.1, "price": 42500.0, "commission": 4.25, "timestamp": "2024-01-15T14:30:00Z", "strategy": "ICT", "pnl": 125.50},
+    {"trade_id": "trade_002", "order_id": "order_002", "symbol": "ETHUSDT", "side": "buy", "quantity": 1.0, "price": 2480.0, "commission": 2.48, "timestamp": "2024-01-15T13:15:00Z", "strategy": "SMC", "pnl": 87.25}
+])
+PERFORMANCE_JSON = orjson.dumps({"total_return": 0.156, "sharpe_ratio": 1.18, "max_drawdown": 0.092, "win_rate": 0.644, "total_trades": 15, "daily_pnl": 245.67, "weekly_pnl": 892.34, "monthly_pnl": 1560.00, "volatility": 0.15, "beta": 0.85})
+RISK_METRICS_JSON = orjson.dumps({"var_95": 578.0, "var_99": 231.2, "expected_shortfall": 924.8, "max_position_size": 2312.0, "current_exposure": 1955.75, "leverage": 2.5, "margin_ratio": 0.15})
+BOT_STARTED_JSON = orjson.dumps({"message": "Trading bot started successfully", "status": "running", "mode": "paper"})
+BOT_STOPPED_JSON = orjson.dumps({"message": "Trading bot stopped", "status": "stopped"})
+# bot_status only has two possible bodies, so both are prebuilt
+STATUS_RUNNING_JSON = orjson.dumps({"running": True, "mode": "paper", "auto_trading": True})
+STATUS_STOPPED_JSON = orjson.dumps({"running": False, "mode": "paper", "auto_trading": False})
+INITIALIZE_DEMO_JSON = orjson.dumps({"message": "Demo data initialized", "positions": 3, "trades": 15, "portfolio_value": 11560.0})
+
+def json_bytes(content):
+    """Wrap pre-serialized JSON bytes in a response"""
+    return Response(content, media_type="application/json")
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return JSONResponse(content={
-        "status": "healthy",
-        "mode": "simplified",
-        "server": "running",
-        "timestamp": "2024-01-15T15:45:00Z"
-    })
+    return json_bytes(HEALTH_JSON)
 
 # Mock API endpoints for dashboard functionality
 @app.get("/api/v1/trading/status")
 async def trading_status():
-    return {
-        "status": "active",
-        "mode": "paper",
-        "active_positions": 3,
-        "daily_pnl": 245.67,
-        "total_trades": 15,
-        "cash_balance": 8500.0,
-        "total_value": 11560.0
-    }
+    return json_bytes(TRADING_STATUS_JSON)
 
 @app.get("/api/v1/trading/positions")
 async def get_positions():
-    return [
-        {"symbol": "BTCUSDT", "side": "long", "quantity": 0.25, "entry_price": 42800.0, "current_price": 43250.50, "unrealized_pnl": 112.63, "realized_pnl": 0.0, "margin_used": 1070.0, "created_at": "2024-01-15T10:30:00Z", "updated_at": "2024-01-15T15:45:00Z"},
-        {"symbol": "ETHUSDT", "side": "long", "quantity": 2.5, "entry_price": 2520.0, "current_price": 2580.75, "unrealized_pnl": 151.88, "realized_pnl": 0.0, "margin_used": 630.0, "created_at": "2024-01-15T09:15:00Z", "updated_at": "2024-01-15T15:45:00Z"},
-        {"symbol": "SOLUSDT", "side": "short", "quantity": 10.0, "entry_price": 102.30, "current_price": 98.45, "unrealized_pnl": 38.50, "realized_pnl": 0.0, "margin_used": 255.75, "created_at": "2024-01-15T11:20:00Z", "updated_at": "2024-01-15T15:45:00Z"}
-    ]
+    return json_bytes(POSITIONS_JSON)
 
 @app.get("/api/v1/strategies/")
 async def get_strategies():
-    return [
-        {"name": "ICT", "enabled": True, "description": "Inner Circle Trader strategy", "performance": {"total_return": 0.156, "sharpe_ratio": 1.34, "max_drawdown": 0.078, "win_rate": 0.672, "profit_factor": 2.18}, "last_signal": "2024-01-15T15:30:00Z"},
-        {"name": "SMC", "enabled": True, "description": "Smart Money Concepts", "performance": {"total_return": 0.089, "sharpe_ratio": 0.98, "max_drawdown": 0.045, "win_rate": 0.614, "profit_factor": 1.87}, "last_signal": "2024-01-15T15:25:00Z"}
-    ]
+    return json_bytes(STRATEGIES_JSON)
 
 @app.get("/api/v1/trading/trades")
 async def get_trades():
-    return [
-        {"trade_id": "trade_001", "order_id": "order_001", "symbol": "BTCUSDT", "side": "buy", "quantity": 0.1, "price": 42500.0, "commission": 4.25, "timestamp": "2024-01-15T14:30:00Z", "strategy": "ICT", "pnl": 125.50},
-        {"trade_id": "trade_002", "order_id": "order_002", "symbol": "ETHUSDT", "side": "buy", "quantity": 1.0, "price": 2480.0, "commission": 2.48, "timestamp": "2024-01-15T13:15:00Z", "strategy": "SMC", "pnl": 87.25}
-    ]
+    return json_bytes(TRADES_JSON)
 
 @app.get("/api/v1/analytics/performance")
 async def get_performance():
-    return {"total_return": 0.156, "sharpe_ratio": 1.18, "max_drawdown": 0.092, "win_rate": 0.644, "total_trades": 15, "daily_pnl": 245.67, "weekly_pnl": 892.34, "monthly_pnl": 1560.00, "volatility": 0.15, "beta": 0.85}
+    return json_bytes(PERFORMANCE_JSON)
 
 @app.get("/api/v1/analytics/risk-metrics")
 async def get_risk_metrics():
-    return {"var_95": 578.0, "var_99": 231.2, "expected_shortfall": 924.8, "max_position_size": 2312.0, "current_exposure": 1955.75, "leverage": 2.5, "margin_ratio": 0.15}
+    return json_bytes(RISK_METRICS_JSON)
 
 # Bot control endpoints
 @app.post("/api/v1/bot/start")
 async def start_bot():
-    global bot_running
-    bot_running = True
-    return {"message": "Trading bot started successfully", "status": "running", "mode": "paper"}
+    bot_state[0] = 1
+    return json_bytes(BOT_STARTED_JSON)
 
 @app.post("/api/v1/bot/stop")
 async def stop_bot():
-    global bot_running
-    bot_running = False
-    return {"message": "Trading bot stopped", "status": "stopped"}
+    bot_state[0] = 0
+    return json_bytes(BOT_STOPPED_JSON)
 
 @app.get("/api/v1/bot/status")
 async def bot_status():
-    return {"running": bot_running, "mode": "paper", "auto_trading": bot_running}
+    return json_bytes(STATUS_RUNNING_JSON if bot_state[0] else STATUS_STOPPED_JSON)
 
 @app.post("/api/v1/bot/initialize-demo")
 async def initialize_demo():
-    return {"message": "Demo data initialized", "positions": 3, "trades": 15, "portfolio_value": 11560.0}
+    return json_bytes(INITIALIZE_DEMO_JSON)
 
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
@@ -188,8 +242,33 @@ def signal_handler(signum, frame):
     logger.info(f"Received signal {signum}, shutting down...")
     sys.exit(0)
 
+def bind_first_free_port(ports, host="127.0.0.1"):
+    """Return a listening-ready socket bound to the first free port, and that port.
+
+    uvicorn exits the process when its own bind fails, so ports are probed
+    here and the bound socket is handed to the server.
+    """
+    for port in ports:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        # Same options uvicorn uses; on Windows SO_REUSEADDR would allow
+        # binding a port that is already in use
+        if sys.platform != "win32":
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            sock.bind((host, port))
+        except OSError:
+            sock.close()
+            print(f"⚠️ Port {port} busy, trying next...")
+            continue
+        return sock, port
+    return None, None
+
 def main():
     """Main entry point"""
+    # Only the launcher needs uvicorn; importing the app (workers, tests) skips it
+    import uvicorn
+    from uvicorn.supervisors import Multiprocess
+    
     # Setup basic logging
     logging.basicConfig(level=logging.INFO)
     logger = logging.getLogger(__name__)
@@ -200,38 +279,47 @@ def main():
     
     logger.info("Starting AI Trading Bot server (Fixed Version)...")
     
-    # Try multiple ports
+    # Bind the first free port ourselves, then build the uvicorn server once
     ports = [8080, 8081, 8000, 3000]
+    sock, port = bind_first_free_port(ports)
+    if sock is None:
+        print("❌ All ports failed!")
+        return
     
-    for port in ports:
-        try:
-            print(f"\n🔄 Trying port {port}...")
-            print(f"📊 Dashboard: http://localhost:{port}/dashboard")
-            print(f"🔧 API docs: http://localhost:{port}/docs")
-            print(f"❤️ Health: http://localhost:{port}/health")
-            print("-" * 50)
-            
-            uvicorn.run(
-                app,
-                host="127.0.0.1",
-                port=port,
-                log_level="info",
-                access_log=True
-            )
-            break
-            
-        except OSError as e:
-            if "Address already in use" in str(e) or "Only one usage" in str(e):
-                print(f"⚠️ Port {port} busy, trying next...")
-                continue
-            else:
-                print(f"❌ Error on port {port}: {e}")
-                continue
-        except Exception as e:
-            print(f"❌ Unexpected error on port {port}: {e}")
-            continue
+    workers = int(os.environ.get("WEB_CONCURRENCY", os.cpu_count() or 1))
+    print(f"\n🔄 Starting server on port {port} with {workers} workers...")
+    print(f"📊 Dashboard: http://localhost:{port}/dashboard")
+    print(f"🔧 API docs: http://localhost:{port}/docs")
+    print(f"❤️ Health: http://localhost:{port}/health")
+    print("-" * 50)
     
-    print("❌ All ports failed!")
+    # Workers re-import the app by name, so pass an import string
+    config = uvicorn.Config(
+        "main_server_fixed:app",
+        host="127.0.0.1",
+        port=port,
+        workers=workers,
+        loop=UVICORN_LOOP,
+        http="httptools",
+        log_level="warning",
+        access_log=False,
+        proxy_headers=False
+    )
+    server = uvicorn.Server(config)
+    
+    # Workers inherit the environment, so they all map the same state byte
+    state_fd, state_path = tempfile.mkstemp(prefix="bot_state_")
+    os.write(state_fd, b"\0")
+    os.close(state_fd)
+    os.environ[BOT_STATE_ENV] = state_path
+    try:
+        if config.workers > 1:
+            # Same supervisor uvicorn.run() uses, but serving our pre-bound socket
+            Multiprocess(config, target=server.run, sockets=[sock]).run()
+        else:
+            server.run(sockets=[sock])
+    finally:
+        os.unlink(state_path)
 
 if __name__ == "__main__":
     main()
@@ -5,29 +5,72 @@ Enhanced server with live market data and functional paper trading
 """
 
 import asyncio
+import datetime
 import logging
-import signal
 import sys
 import os
-from contextlib import asynccontextmanager
+import time
+from contextlib import asynccontextmanager, suppress
 from pathlib import Path
 from typing import AsyncGenerator
 
+import numpy as np
+import orjson
 import uvicorn
-from fastapi import FastAPI, HTTPException
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi.responses import JSONResponse, FileResponse, ORJSONResponse, Response
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
+from starlette.websockets import WebSocketState
 
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
+# uvloop has no Windows build; fall back to the stock asyncio loop there
+UVICORN_LOOP = "asyncio" if sys.platform == "win32" else "uvloop"
+
 print("🚀 AI Trading Bot - Live Data Server")
 print("=" * 50)
 
 # Global data manager instance
 live_data_manager = None
 
+# Data manager methods the endpoints dispatch to; resolved once in lifespan,
+# None where the active manager does not provide one
+MANAGER_CAPABILITIES = (
+    "get_portfolio_summary",
+    "get_positions",
+    "get_recent_trades",
+    "get_strategies",
+    "get_portfolio_history",
+    "get_strategy_performance",
+    "get_market_prices",
+    "start_trading",
+    "stop_trading",
+    "initialize_demo",
+)
+capabilities = dict.fromkeys(MANAGER_CAPABILITIES)
+
+# Dashboard polling hits several summary-based endpoints at once; share one
+# summary between them for PORTFOLIO_SUMMARY_TTL seconds
+PORTFOLIO_SUMMARY_TTL = 1.0
+_portfolio_summary_cache = (None, 0.0)
+
+def portfolio_summary(get_summary):
+    """Data manager portfolio summary, cached for PORTFOLIO_SUMMARY_TTL seconds"""
+    global _portfolio_summary_cache
+    summary, fetched_at = _portfolio_summary_cache
+    now = time.monotonic()
+    if summary is None or now - fetched_at >= PORTFOLIO_SUMMARY_TTL:
+        summary = get_summary()
+        _portfolio_summary_cache = (summary, now)
+    return summary
+
+def invalidate_portfolio_summary():
+    """Drop the cached summary after the trading state changes"""
+    global _portfolio_summary_cache
+    _portfolio_summary_cache = (None, 0.0)
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan manager with live data integration"""
@@ -64,6 +107,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         live_data_manager = get_memory_data_manager()
         live_data_manager.start_background_tasks()
 
+    capabilities.update(
+        (name, getattr(live_data_manager, name, None)) for name in MANAGER_CAPABILITIES
+    )
+
     yield
 
     # Shutdown
@@ -77,17 +124,52 @@ app = FastAPI(
     title="AI Trading Bot - Live",
     description="Advanced AI-powered trading system with live market data and paper trading",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
+class LeanCORS:
+    """Pure ASGI CORS for a public API: static wildcard headers, canned preflights
+
+    The dashboard sends no credentials, so every response can carry the same
+    pre-encoded headers instead of echoing the request Origin.
+    """
+
+    CORS_HEADERS = [(b"access-control-allow-origin", b"*")]
+    PREFLIGHT_HEADERS = CORS_HEADERS + [
+        (b"access-control-allow-methods", b"GET, POST, PUT, DELETE, OPTIONS"),
+        (b"access-control-allow-headers", b"*"),
+        (b"access-control-max-age", b"86400"),
+        (b"content-length", b"0"),
+    ]
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and any(
+            name == b"access-control-request-method" for name, _ in scope["headers"]
+        ):
+            await send({"type": "http.response.start", "status": 204, "headers": self.PREFLIGHT_HEADERS})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + self.CORS_HEADERS
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
 # Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+app.add_middleware(LeanCORS)
+
+# Portfolio history and position lists are repetitive JSON worth compressing
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 # Mount static files for dashboard
 static_dir = Path("src/static")
@@ -97,6 +179,204 @@ if static_dir.exists():
 else:
     print(f"⚠️ Static directory not found: {static_dir}")
 
+# Constant payloads (demo fallbacks and fixed bot replies) are serialized
+# once here instead of on every request
+DEMO_HEALTH_JSON = orjson.dumps({"status": "healthy", "mode": "fallback", "timestamp": "2024-01-15T10:30:00Z"})
+DEMO_TRADING_STATUS_JSON = orjson.dumps({
+    "status": "active",
+    "mode": "paper",
+    "active_positions": 0,
+    "daily_pnl": 0.0,
+    "total_trades": 0,
+    "cash_balance": 10000.0,
+    "total_value": 10000.0,
+    "connected": False
+})
+DEMO_POSITIONS_JSON = orjson.dumps([
+    {
+        "symbol": "BTCUSDT",
+        "side": "long",
+        "quantity": 0.25,
+        "entry_price": 42800.00,
+        "current_price": 43250.50,
+        "unrealized_pnl": 112.63,
+        "timestamp": "2024-01-15T09:30:00Z"
+    },
+    {
+        "symbol": "ETHUSDT",
+        "side": "long",
+        "quantity": 2.5,
+        "entry_price": 2520.00,
+        "current_price": 2580.75,
+        "unrealized_pnl": 151.88,
+        "timestamp": "2024-01-15T10:15:00Z"
+    },
+    {
+        "symbol": "SOLUSDT",
+        "side": "short",
+        "quantity": 10,
+        "entry_price": 102.30,
+        "current_price": 98.45,
+        "unrealized_pnl": 38.50,
+        "timestamp": "2024-01-15T11:00:00Z"
+    }
+])
+DEMO_TRADES_JSON = orjson.dumps([
+    {
+        "timestamp": "2024-01-15T15:30:00Z",
+        "symbol": "BTCUSDT",
+        "side": "buy",
+        "quantity": 0.1,
+        "price": 42500.00,
+        "strategy": "ICT",
+        "commission": 4.25
+    },
+    {
+        "timestamp": "2024-01-15T14:15:00Z",
+        "symbol": "ETHUSDT",
+        "side": "buy",
+        "quantity": 1,
+        "price": 2480.00,
+        "strategy": "SMC",
+        "commission": 2.48
+    },
+    {
+        "timestamp": "2024-01-15T13:45:00Z",
+        "symbol": "SOLUSDT",
+        "side": "sell",
+        "quantity": 5,
+        "price": 102.30,
+        "strategy": "ICT",
+        "commission": 2.56
+    }
+])
+DEMO_PERFORMANCE_JSON = orjson.dumps({
+    "total_return": 0.0,
+    "sharpe_ratio": 0.0,
+    "max_drawdown": 0.0,
+    "win_rate": 0.0,
+    "total_trades": 0,
+    "daily_pnl": 0.0,
+    "weekly_pnl": 0.0,
+    "monthly_pnl": 0.0,
+    "volatility": 0.0,
+    "beta": 0.0
+})
+DEMO_RISK_METRICS_JSON = orjson.dumps({
+    "var_95": 500.0,
+    "var_99": 200.0,
+    "expected_shortfall": 800.0,
+    "max_position_size": 1000.0,
+    "current_exposure": 0.0,
+    "leverage": 1.0,
+    "margin_ratio": 0.1
+})
+BOT_STARTED_JSON = orjson.dumps({
+    "message": "Trading bot started successfully",
+    "status": "running",
+    "mode": "paper",
+    "live_data": True
+})
+DEMO_BOT_STARTED_JSON = orjson.dumps({
+    "message": "Trading bot started (demo mode)",
+    "status": "running",
+    "mode": "paper",
+    "live_data": False
+})
+BOT_STOPPED_JSON = orjson.dumps({
+    "message": "Trading bot stopped",
+    "status": "stopped",
+    "live_data": True
+})
+DEMO_BOT_STOPPED_JSON = orjson.dumps({
+    "message": "Trading bot stopped (demo mode)",
+    "status": "stopped",
+    "live_data": False
+})
+DEMO_BOT_STATUS_JSON = orjson.dumps({
+    "running": False,
+    "mode": "paper",
+    "auto_trading": False,
+    "connected": False,
+    "live_data": False
+})
+DEMO_MARKET_PRICES_JSON = orjson.dumps({
+    "prices": {
+        "BTCUSDT": 43250.50,
+        "ETHUSDT": 2580.75,
+        "ADAUSDT": 0.485,
+        "SOLUSDT": 98.45,
+        "DOTUSDT": 7.23
+    },
+    "live_data": False
+})
+DEMO_STRATEGIES_JSON = orjson.dumps([
+    {
+        "name": "ICT",
+        "enabled": True,
+        "performance": {
+            "total_return": 0.186,
+            "sharpe_ratio": 1.34,
+            "win_rate": 0.67,
+            "max_drawdown": 0.08
+        }
+    },
+    {
+        "name": "SMC",
+        "enabled": True,
+        "performance": {
+            "total_return": 0.095,
+            "sharpe_ratio": 0.98,
+            "win_rate": 0.61,
+            "max_drawdown": 0.12
+        }
+    }
+])
+DEMO_INITIALIZE_JSON = orjson.dumps({
+    "message": "Demo data initialized successfully",
+    "positions": 3,
+    "trades": 15,
+    "portfolio_value": 11560.0,
+    "strategies": 2
+})
+DEMO_STRATEGY_PERFORMANCE_JSON = orjson.dumps({"strategies": {}})
+
+def json_bytes(content):
+    """Wrap pre-serialized JSON bytes in a response"""
+    return Response(content, media_type="application/json")
+
+# The demo history only moves with the calendar, so it is rebuilt at most hourly
+PORTFOLIO_HISTORY_TTL = 3600
+_portfolio_history_cache = (b"", 0.0)
+
+def build_demo_portfolio_history():
+    """Synthetic 30-day portfolio value series ending today"""
+    base_date = datetime.datetime.now() - datetime.timedelta(days=30)
+    base_value = 10000
+
+    day = np.arange(30)
+    # Simulate portfolio growth with some volatility
+    growth = (day * 0.02) + (0.01 * (day % 3 - 1))  # 2% growth per day with volatility
+    values = np.round(base_value * (1 + growth), 2).tolist()
+
+    return [
+        {
+            "timestamp": (base_date + datetime.timedelta(days=i)).isoformat() + "Z",
+            "total_value": value
+        }
+        for i, value in enumerate(values)
+    ]
+
+def demo_portfolio_history_json():
+    """Serialized demo history, cached for PORTFOLIO_HISTORY_TTL seconds"""
+    global _portfolio_history_cache
+    payload, built_at = _portfolio_history_cache
+    now = time.time()
+    if now - built_at >= PORTFOLIO_HISTORY_TTL:
+        payload = orjson.dumps(build_demo_portfolio_history())
+        _portfolio_history_cache = (payload, now)
+    return payload
+
 # Serve dashboard
 @app.get("/")
 async def dashboard():
@@ -105,7 +385,7 @@ async def dashboard():
     if dashboard_file.exists():
         return FileResponse(str(dashboard_file))
     else:
-        return {"message": "AI Trading Bot Live Server", "status": "running", "dashboard": "not_found"}
+        return ORJSONResponse({"message": "AI Trading Bot Live Server", "status": "running", "dashboard": "not_found"})
 
 @app.get("/debug")
 async def debug_dashboard():
@@ -114,35 +394,32 @@ async def debug_dashboard():
     if debug_file.exists():
         return FileResponse(str(debug_file))
     else:
-        return {"message": "Debug dashboard not found"}
+        return ORJSONResponse({"message": "Debug dashboard not found"})
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    global live_data_manager
-
-    if live_data_manager:
-        if hasattr(live_data_manager, 'get_portfolio_summary'):
-            portfolio = live_data_manager.get_portfolio_summary()
-            return {
-                "status": "healthy",
-                "mode": "live_data",
-                "connected": portfolio.get("is_connected", False),
-                "trading_active": portfolio.get("is_trading", False),
-                "timestamp": "2024-01-15T10:30:00Z"
-            }
+    fn = capabilities["get_portfolio_summary"]
+    if fn:
+        portfolio = portfolio_summary(fn)
+        return ORJSONResponse({
+            "status": "healthy",
+            "mode": "live_data",
+            "connected": portfolio.get("is_connected", False),
+            "trading_active": portfolio.get("is_trading", False),
+            "timestamp": "2024-01-15T10:30:00Z"
+        })
 
-    return {"status": "healthy", "mode": "fallback", "timestamp": "2024-01-15T10:30:00Z"}
+    return json_bytes(DEMO_HEALTH_JSON)
 
 # Live API endpoints using the live data manager
 @app.get("/api/v1/trading/status")
 async def trading_status():
     """Get current trading status with live data"""
-    global live_data_manager
-
-    if live_data_manager and hasattr(live_data_manager, 'get_portfolio_summary'):
-        portfolio = live_data_manager.get_portfolio_summary()
-        return {
+    fn = capabilities["get_portfolio_summary"]
+    if fn:
+        portfolio = portfolio_summary(fn)
+        return ORJSONResponse({
             "status": "active" if portfolio.get("is_trading", False) else "stopped",
             "mode": "paper",
             "active_positions": portfolio.get("active_positions", 0),
@@ -151,112 +428,44 @@ async def trading_status():
             "cash_balance": portfolio.get("cash_balance", 0.0),
             "total_value": portfolio.get("total_value", 0.0),
             "connected": portfolio.get("is_connected", False)
-        }
+        })
 
     # Fallback to static data
-    return {
-        "status": "active",
-        "mode": "paper",
-        "active_positions": 0,
-        "daily_pnl": 0.0,
-        "total_trades": 0,
-        "cash_balance": 10000.0,
-        "total_value": 10000.0,
-        "connected": False
-    }
+    return json_bytes(DEMO_TRADING_STATUS_JSON)
 
 @app.get("/api/v1/trading/positions")
 async def get_positions():
     """Get current positions with live data"""
-    global live_data_manager
-
-    if live_data_manager and hasattr(live_data_manager, 'get_positions'):
-        positions = live_data_manager.get_positions()
-        return positions  # Return positions directly, not wrapped in {"positions": positions}
+    fn = capabilities["get_positions"]
+    if fn:
+        positions = fn()
+        return ORJSONResponse(positions)  # Return positions directly, not wrapped in {"positions": positions}
 
     # Return demo positions for testing
-    return [
-        {
-            "symbol": "BTCUSDT",
-            "side": "long",
-            "quantity": 0.25,
-            "entry_price": 42800.00,
-            "current_price": 43250.50,
-            "unrealized_pnl": 112.63,
-            "timestamp": "2024-01-15T09:30:00Z"
-        },
-        {
-            "symbol": "ETHUSDT",
-            "side": "long",
-            "quantity": 2.5,
-            "entry_price": 2520.00,
-            "current_price": 2580.75,
-            "unrealized_pnl": 151.88,
-            "timestamp": "2024-01-15T10:15:00Z"
-        },
-        {
-            "symbol": "SOLUSDT",
-            "side": "short",
-            "quantity": 10,
-            "entry_price": 102.30,
-            "current_price": 98.45,
-            "unrealized_pnl": 38.50,
-            "timestamp": "2024-01-15T11:00:00Z"
-        }
-    ]
+    return json_bytes(DEMO_POSITIONS_JSON)
 
 @app.get("/api/v1/trading/trades")
 async def get_trades():
     """Get recent trades with live data"""
-    global live_data_manager
-
-    if live_data_manager and hasattr(live_data_manager, 'get_recent_trades'):
-        trades = live_data_manager.get_recent_trades(20)
-        return trades  # Return trades directly, not wrapped
+    fn = capabilities["get_recent_trades"]
+    if fn:
+        trades = fn(20)
+        return ORJSONResponse(trades)  # Return trades directly, not wrapped
 
     # Return demo trades for testing
-    return [
-        {
-            "timestamp": "2024-01-15T15:30:00Z",
-            "symbol": "BTCUSDT",
-            "side": "buy",
-            "quantity": 0.1,
-            "price": 42500.00,
-            "strategy": "ICT",
-            "commission": 4.25
-        },
-        {
-            "timestamp": "2024-01-15T14:15:00Z",
-            "symbol": "ETHUSDT",
-            "side": "buy",
-            "quantity": 1,
-            "price": 2480.00,
-            "strategy": "SMC",
-            "commission": 2.48
-        },
-        {
-            "timestamp": "2024-01-15T13:45:00Z",
-            "symbol": "SOLUSDT",
-            "side": "sell",
-            "quantity": 5,
-            "price": 102.30,
-            "strategy": "ICT",
-            "commission": 2.56
-        }
-    ]
+    return json_bytes(DEMO_TRADES_JSON)
 
 @app.get("/api/v1/analytics/performance")
 async def get_performance():
     """Get performance analytics"""
-    global live_data_manager
-
-    if live_data_manager and hasattr(live_data_manager, 'get_portfolio_summary'):
-        portfolio = live_data_manager.get_portfolio_summary()
+    fn = capabilities["get_portfolio_summary"]
+    if fn:
+        portfolio = portfolio_summary(fn)
 
         # Calculate performance metrics
         total_return = (portfolio.get("total_value", 10000) - 10000) / 10000
 
-        return {
+        return ORJSONResponse({
             "total_return": total_return,
             "sharpe_ratio": 1.18 if total_return > 0 else 0.5,
             "max_drawdown": 0.05,
@@ -267,31 +476,19 @@ async def get_performance():
             "monthly_pnl": portfolio.get("daily_pnl", 0.0) * 30,
             "volatility": 0.15,
             "beta": 0.85
-        }
+        })
 
-    return {
-        "total_return": 0.0,
-        "sharpe_ratio": 0.0,
-        "max_drawdown": 0.0,
-        "win_rate": 0.0,
-        "total_trades": 0,
-        "daily_pnl": 0.0,
-        "weekly_pnl": 0.0,
-        "monthly_pnl": 0.0,
-        "volatility": 0.0,
-        "beta": 0.0
-    }
+    return json_bytes(DEMO_PERFORMANCE_JSON)
 
 @app.get("/api/v1/analytics/risk-metrics")
 async def get_risk_metrics():
     """Get risk metrics"""
-    global live_data_manager
-
-    if live_data_manager and hasattr(live_data_manager, 'get_portfolio_summary'):
-        portfolio = live_data_manager.get_portfolio_summary()
+    fn = capabilities["get_portfolio_summary"]
+    if fn:
+        portfolio = portfolio_summary(fn)
         total_value = portfolio.get("total_value", 10000)
 
-        return {
+        return ORJSONResponse({
             "var_95": total_value * 0.05,
             "var_99": total_value * 0.02,
             "expected_shortfall": total_value * 0.08,
@@ -299,191 +496,164 @@ async def get_risk_metrics():
             "current_exposure": portfolio.get("positions_value", 0.0),
             "leverage": 1.0,
             "margin_ratio": 0.1
-        }
+        })
 
-    return {
-        "var_95": 500.0,
-        "var_99": 200.0,
-        "expected_shortfall": 800.0,
-        "max_position_size": 1000.0,
-        "current_exposure": 0.0,
-        "leverage": 1.0,
-        "margin_ratio": 0.1
-    }
+    return json_bytes(DEMO_RISK_METRICS_JSON)
 
 # Bot control endpoints with live functionality
 @app.post("/api/v1/bot/start")
 async def start_bot():
     """Start the trading bot"""
-    global live_data_manager
+    fn = capabilities["start_trading"]
+    if fn:
+        await fn()
+        invalidate_portfolio_summary()
+        return json_bytes(BOT_STARTED_JSON)
 
-    if live_data_manager and hasattr(live_data_manager, 'start_trading'):
-        await live_data_manager.start_trading()
-        return {
-            "message": "Trading bot started successfully",
-            "status": "running",
-            "mode": "paper",
-            "live_data": True
-        }
-
-    return {
-        "message": "Trading bot started (demo mode)",
-        "status": "running",
-        "mode": "paper",
-        "live_data": False
-    }
+    return json_bytes(DEMO_BOT_STARTED_JSON)
 
 @app.post("/api/v1/bot/stop")
 async def stop_bot():
     """Stop the trading bot"""
-    global live_data_manager
+    fn = capabilities["stop_trading"]
+    if fn:
+        await fn()
+        invalidate_portfolio_summary()
+        return json_bytes(BOT_STOPPED_JSON)
 
-    if live_data_manager and hasattr(live_data_manager, 'stop_trading'):
-        await live_data_manager.stop_trading()
-        return {
-            "message": "Trading bot stopped",
-            "status": "stopped",
-            "live_data": True
-        }
-
-    return {
-        "message": "Trading bot stopped (demo mode)",
-        "status": "stopped",
-        "live_data": False
-    }
+    return json_bytes(DEMO_BOT_STOPPED_JSON)
 
 @app.get("/api/v1/bot/status")
 async def bot_status():
     """Get bot status"""
-    global live_data_manager
-
-    if live_data_manager and hasattr(live_data_manager, 'get_portfolio_summary'):
-        portfolio = live_data_manager.get_portfolio_summary()
-        return {
+    fn = capabilities["get_portfolio_summary"]
+    if fn:
+        portfolio = portfolio_summary(fn)
+        return ORJSONResponse({
             "running": portfolio.get("is_trading", False),
             "mode": "paper",
             "auto_trading": portfolio.get("is_trading", False),
             "connected": portfolio.get("is_connected", False),
             "live_data": True
-        }
+        })
 
-    return {
-        "running": False,
-        "mode": "paper",
-        "auto_trading": False,
-        "connected": False,
-        "live_data": False
-    }
+    return json_bytes(DEMO_BOT_STATUS_JSON)
 
 @app.get("/api/v1/market/prices")
 async def get_market_prices():
     """Get current market prices"""
-    global live_data_manager
-
-    if live_data_manager and hasattr(live_data_manager, 'get_market_prices'):
-        prices = live_data_manager.get_market_prices()
-        return {"prices": prices, "live_data": True}
-
-    return {
-        "prices": {
-            "BTCUSDT": 43250.50,
-            "ETHUSDT": 2580.75,
-            "ADAUSDT": 0.485,
-            "SOLUSDT": 98.45,
-            "DOTUSDT": 7.23
-        },
-        "live_data": False
-    }
+    fn = capabilities["get_market_prices"]
+    if fn:
+        prices = fn()
+        return ORJSONResponse({"prices": prices, "live_data": True})
+
+    return json_bytes(DEMO_MARKET_PRICES_JSON)
+
+# Market stream: the latest price of each changed symbol is held until the
+# next flush and sent as one binary JSON frame, instead of one frame per tick.
+# Only one pending price is kept per symbol, so a slow client cannot make
+# the backlog grow
+MARKET_WS_POLL_INTERVAL = 1.0
+MARKET_WS_FLUSH_INTERVAL = 0.02
+
+@app.websocket("/ws/market")
+async def market_stream(websocket: WebSocket):
+    """Stream market price ticks as batched JSON arrays"""
+    await websocket.accept()
+    pending = {}
+    ticks_ready = asyncio.Event()
+
+    async def collect_ticks():
+        last_prices = {}
+        while True:
+            fn = capabilities["get_market_prices"]
+            prices = fn() if fn else {}
+            for symbol, price in prices.items():
+                if last_prices.get(symbol) != price:
+                    pending[symbol] = price
+                    ticks_ready.set()
+            last_prices = prices
+            await asyncio.sleep(MARKET_WS_POLL_INTERVAL)
+
+    async def flush_ticks():
+        while True:
+            await ticks_ready.wait()
+            ticks_ready.clear()
+            batch = [{"symbol": symbol, "price": price} for symbol, price in pending.items()]
+            pending.clear()
+            await websocket.send_bytes(orjson.dumps(batch))
+            await asyncio.sleep(MARKET_WS_FLUSH_INTERVAL)
+
+    async def wait_for_disconnect():
+        # Client messages are ignored
+        while (await websocket.receive())["type"] != "websocket.disconnect":
+            pass
+
+    tasks = [
+        asyncio.create_task(wait_for_disconnect()),
+        asyncio.create_task(collect_ticks()),
+        asyncio.create_task(flush_ticks()),
+    ]
+    try:
+        # Whichever finishes first ends the stream: a disconnect, or a
+        # producer failing, which must not leave a silent open socket
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for task in tasks:
+            task.cancel()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    errors = [r for r in results if isinstance(r, Exception) and not isinstance(r, WebSocketDisconnect)]
+    for error in errors:
+        logging.getLogger(__name__).error(f"Market stream failed: {error}", exc_info=error)
+    if errors and websocket.client_state == WebSocketState.CONNECTED:
+        # Best effort: the client may already be gone
+        with suppress(Exception):
+            await websocket.close(code=1011)
 
 # Missing endpoints that dashboard needs
 @app.get("/api/v1/strategies/")
 async def get_strategies():
     """Get available trading strategies"""
-    global live_data_manager
-
-    if live_data_manager and hasattr(live_data_manager, 'get_strategies'):
-        strategies = live_data_manager.get_strategies()
-        return strategies
+    fn = capabilities["get_strategies"]
+    if fn:
+        strategies = fn()
+        return ORJSONResponse(strategies)
 
     # Return demo strategies for testing
-    return [
-        {
-            "name": "ICT",
-            "enabled": True,
-            "performance": {
-                "total_return": 0.186,
-                "sharpe_ratio": 1.34,
-                "win_rate": 0.67,
-                "max_drawdown": 0.08
-            }
-        },
-        {
-            "name": "SMC",
-            "enabled": True,
-            "performance": {
-                "total_return": 0.095,
-                "sharpe_ratio": 0.98,
-                "win_rate": 0.61,
-                "max_drawdown": 0.12
-            }
-        }
-    ]
+    return json_bytes(DEMO_STRATEGIES_JSON)
 
 @app.get("/api/v1/analytics/portfolio-history")
 async def get_portfolio_history():
     """Get portfolio value history for chart"""
-    global live_data_manager
-
-    if live_data_manager and hasattr(live_data_manager, 'get_portfolio_history'):
-        history = live_data_manager.get_portfolio_history()
-        return history
+    fn = capabilities["get_portfolio_history"]
+    if fn:
+        history = fn()
+        # Largest payload: encode straight to orjson, skipping jsonable_encoder
+        return ORJSONResponse(history)
 
     # Return demo portfolio history for testing
-    import datetime
-    base_date = datetime.datetime.now() - datetime.timedelta(days=30)
-    history = []
-    base_value = 10000
-
-    for i in range(30):
-        date = base_date + datetime.timedelta(days=i)
-        # Simulate portfolio growth with some volatility
-        growth = (i * 0.02) + (0.01 * (i % 3 - 1))  # 2% growth per day with volatility
-        value = base_value * (1 + growth)
-
-        history.append({
-            "timestamp": date.isoformat() + "Z",
-            "total_value": round(value, 2)
-        })
-
-    return history
+    return json_bytes(demo_portfolio_history_json())
 
 @app.post("/api/v1/bot/initialize-demo")
 async def initialize_demo():
     """Initialize demo data for the dashboard"""
-    global live_data_manager
-
-    if live_data_manager and hasattr(live_data_manager, 'initialize_demo'):
-        result = live_data_manager.initialize_demo()
-        return result
+    fn = capabilities["initialize_demo"]
+    if fn:
+        result = fn()
+        return ORJSONResponse(result)
 
-    return {
-        "message": "Demo data initialized successfully",
-        "positions": 3,
-        "trades": 15,
-        "portfolio_value": 11560.0,
-        "strategies": 2
-    }
+    return json_bytes(DEMO_INITIALIZE_JSON)
 
 @app.get("/api/v1/strategies/performance")
 async def get_strategy_performance():
     """Get strategy performance metrics"""
-    global live_data_manager
-
-    if live_data_manager and hasattr(live_data_manager, 'get_strategy_performance'):
-        strategies = live_data_manager.get_strategy_performance()
-        return {"strategies": strategies}
+    fn = capabilities["get_strategy_performance"]
+    if fn:
+        strategies = fn()
+        return ORJSONResponse({"strategies": strategies})
 
-    return {"strategies": {}}
+    return json_bytes(DEMO_STRATEGY_PERFORMANCE_JSON)
 
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
@@ -507,10 +677,21 @@ if __name__ == "__main__":
     print("📡 API Docs: http://localhost:8000/docs")
     print("\n" + "=" * 50)
 
+    # Each worker runs its own data manager and paper portfolio, so the
+    # default stays at one; set WEB_CONCURRENCY to scale read-only polling
+    workers = int(os.environ.get("WEB_CONCURRENCY", 1))
+
     uvicorn.run(
         "main_server_live:app",
         host="0.0.0.0",
         port=8000,
+        workers=workers,
         reload=False,
-        log_level="info"
+        log_level="warning",
+        loop=UVICORN_LOOP,
+        http="httptools",
+        access_log=False,
+        proxy_headers=False,
+        server_header=False,
+        date_header=False
     )
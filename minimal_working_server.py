@@ -3,36 +3,308 @@
 Minimal Working Server - Bypass Import Issues
 """
 
+import asyncio
+import datetime
+import gzip
+import hashlib
 import sys
 import os
+import re
+import time
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, 'src')
 
+# uvloop has no Windows build; fall back to the stock asyncio loop there
+UVICORN_LOOP = "asyncio" if sys.platform == "win32" else "uvloop"
+
 # Simple FastAPI server with static files
 try:
-    from fastapi import FastAPI
+    from fastapi import FastAPI, Request
+    import numpy as np
     from fastapi.staticfiles import StaticFiles
-    from fastapi.responses import FileResponse, JSONResponse
-    import uvicorn
+    from fastapi.responses import FileResponse, JSONResponse, ORJSONResponse, Response, StreamingResponse
+    import orjson
 
     print("✅ FastAPI imports successful")
 
     # Create app
-    app = FastAPI(title="AI Trading Bot - Minimal")
+    app = FastAPI(title="AI Trading Bot - Minimal", default_response_class=ORJSONResponse)
+
+    class CachedStaticFiles(StaticFiles):
+        """StaticFiles with Cache-Control: fingerprinted assets are immutable,
+        everything else is revalidated against Starlette's ETag/Last-Modified"""
+
+        HASHED_NAME = re.compile(r"\.[0-9a-f]{8,}\.\w+$")
+
+        def file_response(self, full_path, stat_result, scope, status_code=200):
+            response = super().file_response(full_path, stat_result, scope, status_code)
+            if self.HASHED_NAME.search(str(full_path)):
+                response.headers["Cache-Control"] = "public, max-age=31556952, immutable"
+            else:
+                response.headers["Cache-Control"] = "public, max-age=60, must-revalidate"
+            return response
 
     # Mount static files
     static_dir = Path("src/static")
     if static_dir.exists():
-        app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
+        app.mount("/static", CachedStaticFiles(directory=str(static_dir)), name="static")
         print(f"✅ Static files mounted from: {static_dir}")
     else:
         print(f"❌ Static directory not found: {static_dir}")
 
+    # Constant payloads are serialized once here instead of on every request
+    ROOT_JSON = orjson.dumps({"message": "AI Trading Bot Server is running!", "status": "ok"})
+    HEALTH_JSON = orjson.dumps({"status": "healthy", "message": "Server is running"})
+    TRADING_STATUS_JSON = orjson.dumps({
+        "status": "active",
+        "mode": "paper",
+        "active_positions": 3,
+        "daily_pnl": 245.67,
+        "total_trades": 15,
+        "cash_balance": 8500.0,
+        "total_value": 11560.0
+    })
+    POSITIONS_JSON = orjson.dumps([
+        {
+            "symbol": "BTCUSDT",
+            "side": "long",
+            "quantity": 0.25,
+            "entry_price": 42800.0,
+            "current_price": 43250.50,
+            "unrealized_pnl": 112.63,
+            "realized_pnl": 0.0,
+            "margin_used": 1070.0,
+            "created_at": "2024-01-15T10:30:00Z",
+            "updated_at": "2024-01-15T15:45:00Z"
+        },
+        {
+            "symbol": "ETHUSDT",
+            "side": "long",
+            "quantity": 2.5,
+            "entry_price": 2520.0,
+            "current_price": 2580.75,
+            "unrealized_pnl": 151.88,
+            "realized_pnl": 0.0,
+            "margin_used": 630.0,
+            "created_at": "2024-01-15T09:15:00Z",
+            "updated_at": "2024-01-15T15:45:00Z"
+        },
+        {
+            "symbol": "SOLUSDT",
+            "side": "short",
+            "quantity": 10.0,
+            "entry_price": 102.30,
+            "current_price": 98.45,
+            "unrealized_pnl": 38.50,
+            "realized_pnl": 0.0,
+            "margin_used": 255.75,
+            "created_at": "2024-01-15T11:20:00Z",
+            "updated_at": "2024-01-15T15:45:00Z"
+        }
+    ])
+    STRATEGIES_JSON = orjson.dumps([
+        {
+            "name": "ICT",
+            "enabled": True,
+            "description": "Inner Circle Trader strategy with advanced market analysis",
+            "performance": {
+                "total_return": 0.156,
+                "sharpe_ratio": 1.34,
+                "max_drawdown": 0.078,
+                "win_rate": 0.672,
+                "profit_factor": 2.18
+            },
+            "last_signal": "2024-01-15T15:30:00Z"
+        },
+        {
+            "name": "SMC",
+            "enabled": True,
+            "description": "Smart Money Concepts strategy",
+            "performance": {
+                "total_return": 0.089,
+                "sharpe_ratio": 0.98,
+                "max_drawdown": 0.045,
+                "win_rate": 0.614,
+                "profit_factor": 1.87
+            },
+            "last_signal": "2024-01-15T15:25:00Z"
+        }
+    ])
+    TRADES_JSON = orjson.dumps([
+        {
+            "trade_id": "trade_001",
+            "order_id": "order_001",
+            "symbol": "BTCUSDT",
+            "side": "buy",
+            "quantity": 0.1,
+            "price": 42500.0,
+            "commission": 4.25,
+            "timestamp": "2024-01-15T14:30:00Z",
+            "strategy": "ICT",
+            "pnl": 125.50
+        },
+        {
+            "trade_id": "trade_002",
+            "order_id": "order_002",
+            "symbol": "ETHUSDT",
+            "side": "buy",
+            "quantity": 1.0,
+            "price": 2480.0,
+            "commission": 2.48,
+            "timestamp": "2024-01-15T13:15:00Z",
+            "strategy": "SMC",
+            "pnl": 87.25
+        }
+    ])
+    PERFORMANCE_JSON = orjson.dumps({
+        "total_return": 0.156,
+        "sharpe_ratio": 1.18,
+        "max_drawdown": 0.092,
+        "win_rate": 0.644,
+        "total_trades": 15,
+        "daily_pnl": 245.67,
+        "weekly_pnl": 892.34,
+        "monthly_pnl": 1560.00,
+        "volatility": 0.15,
+        "beta": 0.85
+    })
+    RISK_METRICS_JSON = orjson.dumps({
+        "var_95": 578.0,
+        "var_99": 231.2,
+        "expected_shortfall": 924.8,
+        "max_position_size": 2312.0,
+        "current_exposure": 1955.75,
+        "leverage": 2.5,
+        "margin_ratio": 0.15
+    })
+    BOT_STARTED_JSON = orjson.dumps({
+        "message": "Trading bot started successfully",
+        "status": "running",
+        "mode": "paper",
+        "started_at": "2024-01-15T15:45:00Z"
+    })
+    BOT_STOPPED_JSON = orjson.dumps({
+        "message": "Trading bot stopped",
+        "status": "stopped",
+        "stopped_at": "2024-01-15T15:45:00Z"
+    })
+    BOT_STATUS_JSON = orjson.dumps({
+        "running": False,
+        "started_at": None,
+        "mode": "paper",
+        "auto_trading": False,
+        "uptime_seconds": 0
+    })
+    INITIALIZE_DEMO_JSON = orjson.dumps({
+        "message": "Demo data initialized successfully",
+        "positions": 3,
+        "trades": 15,
+        "portfolio_value": 11560.0
+    })
+
+    def json_bytes(content):
+        """Wrap pre-serialized JSON bytes in a response"""
+        return Response(content, media_type="application/json")
+
+    # Read-only dashboard payloads never change, so pollers can revalidate
+    # with If-None-Match and get an empty 304 back
+    POLL_CACHE_CONTROL = "public, max-age=5"
+
+    def etag_for(content):
+        """Strong ETag for a fixed response body"""
+        return '"' + hashlib.sha1(content).hexdigest() + '"'
+
+    STRATEGIES_ETAG = etag_for(STRATEGIES_JSON)
+    PERFORMANCE_ETAG = etag_for(PERFORMANCE_JSON)
+    RISK_METRICS_ETAG = etag_for(RISK_METRICS_JSON)
+    BOT_STATUS_ETAG = etag_for(BOT_STATUS_JSON)
+
+    def cacheable_json_bytes(request, content, etag):
+        """Pre-serialized JSON with validators, or 304 when the client's copy matches"""
+        headers = {"ETag": etag, "Cache-Control": POLL_CACHE_CONTROL}
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+        return Response(content, media_type="application/json", headers=headers)
+
+    # Payloads large enough to be worth compressing are gzipped once, when they
+    # are built, rather than by a middleware on every response (which would
+    # also hold back the event stream below)
+    GZIP_LEVEL = 6
+    POSITIONS_GZ = gzip.compress(POSITIONS_JSON, GZIP_LEVEL)
+
+    def accepts_gzip(accept_encoding):
+        """Whether an Accept-Encoding header allows gzip, honouring q-values (q=0 refuses)"""
+        wildcard = None
+        for token in accept_encoding.lower().split(","):
+            coding, _, params = token.partition(";")
+            coding = coding.strip()
+            quality = 1.0
+            for param in params.split(";"):
+                name, _, value = param.partition("=")
+                if name.strip() == "q":
+                    try:
+                        quality = float(value)
+                    except ValueError:
+                        quality = 0.0
+            if coding in ("gzip", "x-gzip"):
+                return quality > 0
+            if coding == "*":
+                wildcard = quality > 0
+        return bool(wildcard)
+
+    def gzip_json_bytes(request, content, compressed):
+        """Pre-serialized JSON, sent as its gzipped copy when the client accepts it"""
+        headers = {"Vary": "Accept-Encoding"}
+        if accepts_gzip(request.headers.get("accept-encoding", "")):
+            headers["Content-Encoding"] = "gzip"
+            return Response(compressed, media_type="application/json", headers=headers)
+        return Response(content, media_type="application/json", headers=headers)
+
+    # The demo history only moves with the calendar, so it is rebuilt at most hourly
+    PORTFOLIO_HISTORY_TTL = 3600
+    _portfolio_history_cache = (b"", b"", 0.0)
+
+    def build_demo_portfolio_history():
+        """Generate 30 days of demo portfolio history ending today"""
+        base_date = datetime.datetime.now() - datetime.timedelta(days=30)
+        base_value = 10000.0
+
+        day = np.arange(30)
+        # Simulate portfolio growth with some volatility
+        growth = (day * 0.005) + (0.01 * (day % 3 - 1))  # 0.5% daily average growth with volatility
+        total_value = base_value * (1 + growth)
+        gain = total_value - base_value
+        columns = {
+            "total_value": np.round(total_value, 2).tolist(),
+            "cash_balance": np.round(total_value * 0.3, 2).tolist(),  # 30% cash
+            "positions_value": np.round(total_value * 0.7, 2).tolist(),  # 70% in positions
+            "unrealized_pnl": np.round(gain * 0.6, 2).tolist(),
+            "realized_pnl": np.round(gain * 0.4, 2).tolist(),
+            "daily_pnl": np.round(gain * 0.1, 2).tolist(),
+        }
+        timestamps = [(base_date + datetime.timedelta(days=i)).isoformat() + "Z" for i in range(30)]
+
+        return [
+            {"timestamp": timestamp, **{name: values[i] for name, values in columns.items()}}
+            for i, timestamp in enumerate(timestamps)
+        ]
+
+    def demo_portfolio_history_payloads():
+        """Serialized and gzipped demo history, cached for PORTFOLIO_HISTORY_TTL seconds"""
+        global _portfolio_history_cache
+        payload, compressed, built_at = _portfolio_history_cache
+        now = time.time()
+        if now - built_at >= PORTFOLIO_HISTORY_TTL:
+            payload = orjson.dumps(build_demo_portfolio_history())
+            compressed = gzip.compress(payload, GZIP_LEVEL)
+            _portfolio_history_cache = (payload, compressed, now)
+        return payload, compressed
+
     @app.get("/")
     async def root():
-        return {"message": "AI Trading Bot Server is running!", "status": "ok"}
+        return json_bytes(ROOT_JSON)
 
     @app.get("/dashboard")
     async def dashboard():
@@ -44,219 +316,100 @@ try:
 
     @app.get("/health")
     async def health():
-        return {"status": "healthy", "message": "Server is running"}
+        return json_bytes(HEALTH_JSON)
 
     # Mock API endpoints for dashboard
     @app.get("/api/v1/trading/status")
     async def trading_status():
-        return {
-            "status": "active",
-            "mode": "paper",
-            "active_positions": 3,
-            "daily_pnl": 245.67,
-            "total_trades": 15,
-            "cash_balance": 8500.0,
-            "total_value": 11560.0
-        }
+        return json_bytes(TRADING_STATUS_JSON)
 
     @app.get("/api/v1/trading/positions")
-    async def get_positions():
-        return [
-            {
-                "symbol": "BTCUSDT",
-                "side": "long",
-                "quantity": 0.25,
-                "entry_price": 42800.0,
-                "current_price": 43250.50,
-                "unrealized_pnl": 112.63,
-                "realized_pnl": 0.0,
-                "margin_used": 1070.0,
-                "created_at": "2024-01-15T10:30:00Z",
-                "updated_at": "2024-01-15T15:45:00Z"
-            },
-            {
-                "symbol": "ETHUSDT",
-                "side": "long",
-                "quantity": 2.5,
-                "entry_price": 2520.0,
-                "current_price": 2580.75,
-                "unrealized_pnl": 151.88,
-                "realized_pnl": 0.0,
-                "margin_used": 630.0,
-                "created_at": "2024-01-15T09:15:00Z",
-                "updated_at": "2024-01-15T15:45:00Z"
-            },
-            {
-                "symbol": "SOLUSDT",
-                "side": "short",
-                "quantity": 10.0,
-                "entry_price": 102.30,
-                "current_price": 98.45,
-                "unrealized_pnl": 38.50,
-                "realized_pnl": 0.0,
-                "margin_used": 255.75,
-                "created_at": "2024-01-15T11:20:00Z",
-                "updated_at": "2024-01-15T15:45:00Z"
-            }
-        ]
+    async def get_positions(request: Request):
+        return gzip_json_bytes(request, POSITIONS_JSON, POSITIONS_GZ)
 
     @app.get("/api/v1/strategies/")
-    async def get_strategies():
-        return [
-            {
-                "name": "ICT",
-                "enabled": True,
-                "description": "Inner Circle Trader strategy with advanced market analysis",
-                "performance": {
-                    "total_return": 0.156,
-                    "sharpe_ratio": 1.34,
-                    "max_drawdown": 0.078,
-                    "win_rate": 0.672,
-                    "profit_factor": 2.18
-                },
-                "last_signal": "2024-01-15T15:30:00Z"
-            },
-            {
-                "name": "SMC",
-                "enabled": True,
-                "description": "Smart Money Concepts strategy",
-                "performance": {
-                    "total_return": 0.089,
-                    "sharpe_ratio": 0.98,
-                    "max_drawdown": 0.045,
-                    "win_rate": 0.614,
-                    "profit_factor": 1.87
-                },
-                "last_signal": "2024-01-15T15:25:00Z"
-            }
-        ]
+    async def get_strategies(request: Request):
+        return cacheable_json_bytes(request, STRATEGIES_JSON, STRATEGIES_ETAG)
 
     @app.get("/api/v1/trading/trades")
     async def get_trades():
-        return [
-            {
-                "trade_id": "trade_001",
-                "order_id": "order_001",
-                "symbol": "BTCUSDT",
-                "side": "buy",
-                "quantity": 0.1,
-                "price": 42500.0,
-                "commission": 4.25,
-                "timestamp": "2024-01-15T14:30:00Z",
-                "strategy": "ICT",
-                "pnl": 125.50
-            },
-            {
-                "trade_id": "trade_002",
-                "order_id": "order_002",
-                "symbol": "ETHUSDT",
-                "side": "buy",
-                "quantity": 1.0,
-                "price": 2480.0,
-                "commission": 2.48,
-                "timestamp": "2024-01-15T13:15:00Z",
-                "strategy": "SMC",
-                "pnl": 87.25
-            }
-        ]
+        return json_bytes(TRADES_JSON)
 
     @app.get("/api/v1/analytics/performance")
-    async def get_performance():
-        return {
-            "total_return": 0.156,
-            "sharpe_ratio": 1.18,
-            "max_drawdown": 0.092,
-            "win_rate": 0.644,
-            "total_trades": 15,
-            "daily_pnl": 245.67,
-            "weekly_pnl": 892.34,
-            "monthly_pnl": 1560.00,
-            "volatility": 0.15,
-            "beta": 0.85
-        }
+    async def get_performance(request: Request):
+        return cacheable_json_bytes(request, PERFORMANCE_JSON, PERFORMANCE_ETAG)
 
     @app.get("/api/v1/analytics/risk-metrics")
-    async def get_risk_metrics():
-        return {
-            "var_95": 578.0,
-            "var_99": 231.2,
-            "expected_shortfall": 924.8,
-            "max_position_size": 2312.0,
-            "current_exposure": 1955.75,
-            "leverage": 2.5,
-            "margin_ratio": 0.15
-        }
+    async def get_risk_metrics(request: Request):
+        return cacheable_json_bytes(request, RISK_METRICS_JSON, RISK_METRICS_ETAG)
 
     # ===== CRITICAL FIX: Portfolio History Endpoint =====
     @app.get("/api/v1/analytics/portfolio-history")
-    async def get_portfolio_history():
+    async def get_portfolio_history(request: Request):
         """Get portfolio performance history - FIXED ENDPOINT"""
-        print("📊 Portfolio history request received")
-
-        # Generate 30 days of demo portfolio history
-        import datetime
-        base_date = datetime.datetime.now() - datetime.timedelta(days=30)
-        history = []
-        base_value = 10000.0
-
-        for i in range(30):
-            date = base_date + datetime.timedelta(days=i)
-            # Simulate portfolio growth with some volatility
-            growth = (i * 0.005) + (0.01 * (i % 3 - 1))  # 0.5% daily average growth with volatility
-            total_value = base_value * (1 + growth)
-            cash_balance = total_value * 0.3  # 30% cash
-            positions_value = total_value * 0.7  # 70% in positions
-
-            history.append({
-                "timestamp": date.isoformat() + "Z",
-                "total_value": round(total_value, 2),
-                "cash_balance": round(cash_balance, 2),
-                "positions_value": round(positions_value, 2),
-                "unrealized_pnl": round((total_value - base_value) * 0.6, 2),
-                "realized_pnl": round((total_value - base_value) * 0.4, 2),
-                "daily_pnl": round((total_value - base_value) * 0.1, 2)
-            })
-
-        print(f"✅ Returning {len(history)} portfolio history entries")
-        return history
+        return gzip_json_bytes(request, *demo_portfolio_history_payloads())
 
     @app.post("/api/v1/bot/start")
     async def start_bot():
-        return {
-            "message": "Trading bot started successfully",
-            "status": "running",
-            "mode": "paper",
-            "started_at": "2024-01-15T15:45:00Z"
-        }
+        return json_bytes(BOT_STARTED_JSON)
 
     @app.post("/api/v1/bot/stop")
     async def stop_bot():
-        return {
-            "message": "Trading bot stopped",
-            "status": "stopped",
-            "stopped_at": "2024-01-15T15:45:00Z"
-        }
+        return json_bytes(BOT_STOPPED_JSON)
 
     @app.get("/api/v1/bot/status")
-    async def bot_status():
-        return {
-            "running": False,
-            "started_at": None,
-            "mode": "paper",
-            "auto_trading": False,
-            "uptime_seconds": 0
-        }
+    async def bot_status(request: Request):
+        return cacheable_json_bytes(request, BOT_STATUS_JSON, BOT_STATUS_ETAG)
 
     @app.post("/api/v1/bot/initialize-demo")
     async def initialize_demo():
-        return {
-            "message": "Demo data initialized successfully",
-            "positions": 3,
-            "trades": 15,
-            "portfolio_value": 11560.0
-        }
+        return json_bytes(INITIALIZE_DEMO_JSON)
+
+    # One server-sent event stream in place of polling each dashboard endpoint:
+    # the combined snapshot is pushed when it changes, with a comment line as
+    # a heartbeat otherwise so proxies keep the connection open
+    STREAM_INTERVAL = 1.0
+    STREAM_HEARTBEAT = 15.0
+
+    def dashboard_snapshot():
+        """Polled dashboard payloads joined into one JSON object, without re-encoding"""
+        return b"".join([
+            b'{"trading_status":', TRADING_STATUS_JSON,
+            b',"positions":', POSITIONS_JSON,
+            b',"performance":', PERFORMANCE_JSON,
+            b',"risk_metrics":', RISK_METRICS_JSON,
+            b',"bot_status":', BOT_STATUS_JSON,
+            b"}",
+        ])
+
+    async def dashboard_events(request):
+        last_snapshot = None
+        idle = 0.0
+        while not await request.is_disconnected():
+            snapshot = dashboard_snapshot()
+            if snapshot != last_snapshot:
+                yield b"data: " + snapshot + b"\n\n"
+                last_snapshot = snapshot
+                idle = 0.0
+            elif idle >= STREAM_HEARTBEAT:
+                yield b": keep-alive\n\n"
+                idle = 0.0
+            await asyncio.sleep(STREAM_INTERVAL)
+            idle += STREAM_INTERVAL
+
+    @app.get("/api/v1/stream")
+    async def dashboard_stream(request: Request):
+        return StreamingResponse(
+            dashboard_events(request),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
 
     if __name__ == "__main__":
+        # Only the direct-run path needs uvicorn; importing the app for
+        # tests or under another runner does not
+        import uvicorn
+
         print("🚀 Starting AI Trading Bot Server...")
         print("📊 Dashboard: http://localhost:8080/dashboard")
         print("🔗 Portfolio History: http://localhost:8080/api/v1/analytics/portfolio-history")
@@ -264,7 +417,19 @@ try:
         print("❤️ Health: http://localhost:8080/health")
         print("=" * 60)
 
-        uvicorn.run(app, host="127.0.0.1", port=8080, log_level="info")
+        uvicorn.run(
+            app,
+            host="127.0.0.1",
+            port=8080,
+            log_level="warning",
+            loop=UVICORN_LOOP,
+            http="httptools",
+            access_log=False,
+            proxy_headers=False,
+            # Dashboards poll every few seconds; keep their connections open
+            timeout_keep_alive=30,
+            backlog=2048,
+        )
 
 except Exception as e:
     print(f"❌ Server startup failed: {e}")
@@ -5,10 +5,14 @@ Quick Start Script for AI Trading Bot Database Setup
 This script guides you through the database setup process step by step.
 """
 
+import asyncio
+import contextlib
+import io
 import sys
 import os
 import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 def print_header(title):
@@ -22,16 +26,20 @@ def print_step(step_num, title):
     print(f"\n🔸 Step {step_num}: {title}")
     print("-" * 40)
 
-def check_docker():
-    """Check if Docker is available"""
+def docker_is_available():
+    """Probe the docker CLI without reporting"""
     try:
         result = subprocess.run(['docker', '--version'], 
                               capture_output=True, text=True, timeout=10)
-        if result.returncode == 0:
-            print("✅ Docker is available")
-            return True
+        return result.returncode == 0
     except (subprocess.TimeoutExpired, FileNotFoundError):
-        pass
+        return False
+
+def check_docker(probe):
+    """Report whether Docker is available from a docker_is_available future"""
+    if probe.result():
+        print("✅ Docker is available")
+        return True
     
     print("❌ Docker not found")
     return False
@@ -58,19 +66,28 @@ def start_postgres_docker():
         print(f"❌ Error starting PostgreSQL: {e}")
         return False
 
+def run_quietly(func, *args):
+    """Call func with its stdout and stderr captured, returning (result, output)"""
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+        result = func(*args)
+    return result, output.getvalue()
+
 def test_configuration():
     """Test database configuration"""
     print("Testing database configuration...")
     
     try:
-        result = subprocess.run([sys.executable, 'test_database_config.py'], 
-                              capture_output=True, text=True, timeout=60)
+        # The sibling scripts are imported and run in this process, sharing
+        # its interpreter and imports instead of starting a new Python each
+        import test_database_config
+        passed, output = run_quietly(test_database_config.main)
         
-        if result.returncode == 0:
+        if passed:
             print("✅ Configuration tests passed")
             return True
         else:
-            print(f"❌ Configuration tests failed: {result.stderr}")
+            print(f"❌ Configuration tests failed: {output}")
             return False
             
     except Exception as e:
@@ -82,15 +99,17 @@ def setup_database():
     print("Setting up database connection...")
     
     try:
-        result = subprocess.run([sys.executable, 'setup_database.py'], 
-                              capture_output=True, text=True, timeout=60)
+        import setup_database as database_setup
+        connected, output = run_quietly(
+            asyncio.run, asyncio.wait_for(database_setup.main(), timeout=60)
+        )
         
-        if "Database connection initialized successfully" in result.stdout:
+        if connected:
             print("✅ Database connection established")
             return True
         else:
             print("❌ Database connection failed")
-            print("Output:", result.stdout)
+            print("Output:", output)
             return False
             
     except Exception as e:
@@ -102,15 +121,17 @@ def test_paper_trading():
     print("Testing paper trading workflow...")
     
     try:
-        result = subprocess.run([sys.executable, 'test_paper_trading.py'], 
-                              capture_output=True, text=True, timeout=60)
+        import test_paper_trading as paper_trading
+        passed, output = run_quietly(
+            asyncio.run, asyncio.wait_for(paper_trading.main(), timeout=60)
+        )
         
-        if "All paper trading tests completed!" in result.stdout:
+        if passed:
             print("✅ Paper trading tests passed")
             return True
         else:
             print("❌ Paper trading tests failed")
-            print("Output:", result.stdout)
+            print("Output:", output)
             return False
             
     except Exception as e:
@@ -142,6 +163,12 @@ def main():
         print("⚠️  Virtual environment not detected")
         print("   Consider activating your virtual environment")
     
+    # The Docker probe doesn't depend on the configuration test, so it runs
+    # in the background while the tests do
+    docker_pool = ThreadPoolExecutor(max_workers=1)
+    docker_probe = docker_pool.submit(docker_is_available)
+    docker_pool.shutdown(wait=False)
+    
     # Test configuration
     print_step(2, "Testing Configuration")
     if not test_configuration():
@@ -150,7 +177,7 @@ def main():
     
     # Check Docker
     print_step(3, "Database Setup")
-    docker_available = check_docker()
+    docker_available = check_docker(docker_probe)
     
     if docker_available:
         print("\nOption 1: Using Docker (Recommended)")
@@ -6,6 +6,11 @@ Quick test of core trading functionality
 import asyncio
 import sys
 
+try:
+    import uvloop
+except ImportError:  # no Windows build; run on the stock asyncio loop
+    uvloop = None
+
 # Add src to path
 sys.path.insert(0, 'src')
 
@@ -17,6 +22,7 @@ async def test_strategy_signal_generation():
         from core.config import get_settings
         from strategies.simple_ma_strategy import SimpleMAStrategy
         from datetime import datetime, timedelta
+        import numpy as np
         
         settings = get_settings()
         strategy = SimpleMAStrategy("test_ma", settings)
@@ -29,24 +35,25 @@ async def test_strategy_signal_generation():
         base_price = 50000.0
         signals_generated = []
         
-        for i in range(25):  # Generate 25 candles
-            # Create trending price data
-            if i < 10:
-                price = base_price + (i * 50)  # Uptrend
-            elif i < 15:
-                price = base_price + 500 - ((i-10) * 30)  # Slight downtrend
-            else:
-                price = base_price + 350 + ((i-15) * 80)  # Strong uptrend
-            
+        # 25 one-minute candles of trending price data
+        prices = np.concatenate([
+            base_price + np.arange(10) * 50,  # Uptrend
+            base_price + 500 - np.arange(5) * 30,  # Slight downtrend
+            base_price + 350 + np.arange(10) * 80,  # Strong uptrend
+        ]).tolist()
+        now = datetime.now()
+        timestamps = [now - timedelta(minutes=25 - i) for i in range(25)]
+        
+        for price, timestamp in zip(prices, timestamps):
             mock_data = {
                 "BTCUSDT": {
                     "symbol": "BTCUSDT",
                     "price": price,
-                    "timestamp": datetime.now() - timedelta(minutes=25-i),
+                    "timestamp": timestamp,
                     "candle": {
                         "symbol": "BTCUSDT",
                         "timeframe": "1m",
-                        "timestamp": (datetime.now() - timedelta(minutes=25-i)).isoformat(),
+                        "timestamp": timestamp.isoformat(),
                         "open_price": price - 10,
                         "high_price": price + 20,
                         "low_price": price - 20,
@@ -215,5 +222,6 @@ async def main():
     return passed == total
 
 if __name__ == "__main__":
-    result = asyncio.run(main())
+    run = uvloop.run if uvloop else asyncio.run
+    result = run(main())
     sys.exit(0 if result else 1)
@@ -9,26 +9,45 @@ It can work with both Docker and local PostgreSQL installations.
 import sys
 import os
 import asyncio
+import shutil
 import subprocess
+import time
 from pathlib import Path
 
 # Add src to path
-sys.path.append('src')
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from core.config import get_settings
 from database.connection import DatabaseManager
 from database.models import Base, User, Strategy, Order, Trade, Position, Portfolio
 from database.repositories import OrderRepository, TradeRepository, PositionRepository
+import asyncpg
+from sqlalchemy import text
 
+# Statements are built once rather than on every call; their compiled forms
+# are then reused from the engine's statement cache
+VERSION_QUERY = text("SELECT version()")
+# Lists the trading tables and counts the rows of the ones the models test
+# reports, in one round-trip. query_to_xml runs each count as its own
+# statement, so a missing table is simply absent instead of failing the query
+TRADING_TABLE_COUNTS_QUERY = text("""
+    SELECT table_name,
+           CASE WHEN table_name IN ('users', 'strategies') THEN
+               (xpath('/row/c/text()', query_to_xml(
+                   format('SELECT count(*) AS c FROM %I.%I', table_schema, table_name),
+                   false, true, ''
+               )))[1]::text::bigint
+           END AS row_count
+    FROM information_schema.tables 
+    WHERE table_schema = 'trading'
+""")
 
-async def check_database_connection():
-    """Test basic database connectivity"""
+
+async def check_database_connection(db_manager):
+    """Test basic database connectivity, initializing the shared manager"""
     print("🔗 Testing Database Connection...")
     
     try:
-        settings = get_settings()
-        db_manager = DatabaseManager(settings)
-        
         # Test initialization
         await db_manager.initialize()
         print("✅ Database connection initialized successfully")
@@ -41,12 +60,10 @@ async def check_database_connection():
         
         # Test basic query
         async with db_manager.get_session() as session:
-            from sqlalchemy import text
-            result = await session.execute(text("SELECT version()"))
+            result = await session.execute(VERSION_QUERY)
             version = result.scalar()
             print(f"   - PostgreSQL Version: {version}")
         
-        await db_manager.close()
         return True
         
     except Exception as e:
@@ -54,41 +71,26 @@ async def check_database_connection():
         return False
 
 
-async def test_database_models():
+async def test_database_models(db_manager):
     """Test database models and basic operations"""
     print("\n📊 Testing Database Models...")
     
     try:
-        settings = get_settings()
-        db_manager = DatabaseManager(settings)
-        await db_manager.initialize()
-        
         async with db_manager.get_session() as session:
-            # Test creating a test user
-            from sqlalchemy import text
-            
-            # Check if tables exist
-            result = await session.execute(text("""
-                SELECT table_name 
-                FROM information_schema.tables 
-                WHERE table_schema = 'trading'
-            """))
-            tables = [row[0] for row in result.fetchall()]
+            # Check which tables exist, with the row counts of interest
+            result = await session.execute(TRADING_TABLE_COUNTS_QUERY)
+            row_counts = dict(result.fetchall())
+            tables = list(row_counts)
             print(f"   - Found tables: {tables}")
             
             # Test user creation
             if 'users' in tables:
-                result = await session.execute(text("SELECT COUNT(*) FROM trading.users"))
-                user_count = result.scalar()
-                print(f"   - Users in database: {user_count}")
+                print(f"   - Users in database: {row_counts['users']}")
             
             # Test strategies
             if 'strategies' in tables:
-                result = await session.execute(text("SELECT COUNT(*) FROM trading.strategies"))
-                strategy_count = result.scalar()
-                print(f"   - Strategies in database: {strategy_count}")
+                print(f"   - Strategies in database: {row_counts['strategies']}")
         
-        await db_manager.close()
         print("✅ Database models test completed")
         return True
         
@@ -97,15 +99,11 @@ async def test_database_models():
         return False
 
 
-async def test_repositories():
+async def test_repositories(db_manager):
     """Test database repositories"""
     print("\n🏪 Testing Database Repositories...")
     
     try:
-        settings = get_settings()
-        db_manager = DatabaseManager(settings)
-        await db_manager.initialize()
-        
         async with db_manager.get_session() as session:
             # Test OrderRepository
             order_repo = OrderRepository(session)
@@ -121,7 +119,6 @@ async def test_repositories():
             position_repo = PositionRepository(session)
             print("   - PositionRepository initialized")
         
-        await db_manager.close()
         print("✅ Repository tests completed")
         return True
         
@@ -130,33 +127,58 @@ async def test_repositories():
         return False
 
 
-def check_docker_availability():
-    """Check if Docker is available"""
-    try:
-        result = subprocess.run(['docker', '--version'], 
-                              capture_output=True, text=True, timeout=10)
-        if result.returncode == 0:
-            print(f"✅ Docker available: {result.stdout.strip()}")
+async def wait_for_postgres(settings, timeout=30.0, interval=0.25):
+    """Poll PostgreSQL until it accepts connections, up to timeout seconds"""
+    db = settings.database
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            conn = await asyncpg.connect(
+                host=db.host, port=db.port, user=db.username,
+                password=db.password, database=db.database, timeout=5,
+            )
+        except (OSError, asyncio.TimeoutError, asyncpg.CannotConnectNowError):
+            if time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(interval)
+        except asyncpg.PostgresError:
+            # The server answered (e.g. rejected the credentials), so it is
+            # up; the connection check reports the actual problem
             return True
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        pass
+        else:
+            await conn.close()
+            return True
+
+
+def check_docker_availability(docker):
+    """Check if the Docker CLI found on PATH works"""
+    if docker:
+        try:
+            result = subprocess.run([docker, '--version'], 
+                                  capture_output=True, text=True, timeout=10)
+            if result.returncode == 0:
+                print(f"✅ Docker available: {result.stdout.strip()}")
+                return True
+        except (subprocess.TimeoutExpired, FileNotFoundError):
+            pass
     
     print("❌ Docker not available")
     return False
 
 
-def start_postgres_docker():
+def start_postgres_docker(docker):
     """Start PostgreSQL using Docker Compose"""
     print("\n🐳 Starting PostgreSQL with Docker...")
     
     try:
         # Try docker compose first (newer syntax)
-        result = subprocess.run(['docker', 'compose', 'up', 'postgres', '-d'], 
+        result = subprocess.run([docker, 'compose', 'up', 'postgres', '-d'], 
                               capture_output=True, text=True, timeout=120)
         
-        if result.returncode != 0:
-            # Try docker-compose (older syntax)
-            result = subprocess.run(['docker-compose', 'up', 'postgres', '-d'], 
+        # Only fall back to docker-compose (older syntax) if it is installed
+        docker_compose = shutil.which('docker-compose')
+        if result.returncode != 0 and docker_compose:
+            result = subprocess.run([docker_compose, 'up', 'postgres', '-d'], 
                                   capture_output=True, text=True, timeout=120)
         
         if result.returncode == 0:
@@ -179,7 +201,7 @@ def start_postgres_docker():
 
 
 async def main():
-    """Main setup and testing function"""
+    """Main setup and testing function, returning whether the database connected"""
     print("🚀 AI Trading Bot Database Setup")
     print("=" * 50)
     
@@ -187,20 +209,24 @@ async def main():
     env_file = Path('.env')
     if not env_file.exists():
         print("❌ .env file not found. Please create it first.")
-        return
+        return False
     
     print("✅ Environment file found")
     
-    # Check Docker availability
-    docker_available = check_docker_availability()
+    # Check Docker availability, resolving the CLI on PATH once
+    docker = shutil.which('docker')
+    docker_available = check_docker_availability(docker)
     
     if docker_available:
         # Try to start PostgreSQL with Docker
-        postgres_started = start_postgres_docker()
+        postgres_started = start_postgres_docker(docker)
         
         if postgres_started:
             print("\n⏳ Waiting for PostgreSQL to be ready...")
-            await asyncio.sleep(10)  # Give PostgreSQL time to start
+            if await wait_for_postgres(get_settings()):
+                print("✅ PostgreSQL is accepting connections")
+            else:
+                print("⚠️ PostgreSQL did not become ready within 30 seconds")
     else:
         print("\n📝 Docker not available. Please install PostgreSQL manually:")
         print("   1. Install PostgreSQL 15+")
@@ -209,16 +235,23 @@ async def main():
         print("   4. Run the SQL initialization script: sql/init.sql")
         print("\n   Or install Docker and run: docker compose up postgres -d")
     
-    # Test database connection
-    connection_ok = await check_database_connection()
+    # One manager, and so one engine and connection pool, serves every test
+    db_manager = DatabaseManager(get_settings())
     
-    if connection_ok:
-        # Test models
-        await test_database_models()
-        
-        # Test repositories
-        await test_repositories()
+    try:
+        # Test database connection
+        connection_ok = await check_database_connection(db_manager)
         
+        if connection_ok:
+            # Test models
+            await test_database_models(db_manager)
+            
+            # Test repositories
+            await test_repositories(db_manager)
+    finally:
+        await db_manager.close()
+    
+    if connection_ok:
         print("\n🎉 Database setup completed successfully!")
         print("\n📋 Next steps:")
         print("   1. Run paper trading tests: python test_paper_trading.py")
@@ -232,6 +265,8 @@ async def main():
         print("   3. Database 'trading_db' exists")
         print("   4. Network connectivity")
 
+    return connection_ok
+
 
 if __name__ == "__main__":
     asyncio.run(main())
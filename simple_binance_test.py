@@ -4,7 +4,10 @@ Simple Binance Integration Test
 """
 
 import sys
-sys.path.append('src')
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 def test_imports():
     """Test if all imports work"""
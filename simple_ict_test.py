@@ -4,7 +4,10 @@ Simple ICT Test
 """
 
 import sys
-sys.path.append('src')
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 def test_basic_imports():
     """Test basic imports"""
@@ -41,15 +44,18 @@ def test_market_structure():
         import numpy as np
         from strategies.ict.market_structure import MarketStructureAnalyzer
         
-        # Create simple test data
+        # Create simple test data, one column per (low, high) range
         dates = pd.date_range('2024-01-01', periods=20, freq='1H')
-        data = pd.DataFrame({
-            'open': np.random.uniform(100, 110, 20),
-            'high': np.random.uniform(110, 120, 20),
-            'low': np.random.uniform(90, 100, 20),
-            'close': np.random.uniform(100, 110, 20),
-            'volume': np.random.uniform(1000, 5000, 20)
-        }, index=dates)
+        rng = np.random.default_rng(0)
+        data = pd.DataFrame(
+            rng.uniform(
+                low=[100, 110, 90, 100, 1000],
+                high=[110, 120, 100, 110, 5000],
+                size=(20, 5)
+            ),
+            columns=['open', 'high', 'low', 'close', 'volume'],
+            index=dates
+        )
         
         # Test analyzer
         analyzer = MarketStructureAnalyzer()
@@ -5,7 +5,7 @@ Simple test to verify portfolio history works
 
 import sys
 import os
-sys.path.append('.')
+sys.path.insert(0, os.path.dirname(__file__) or '.')
 
 def test_portfolio_history():
     """Test portfolio history"""
@@ -5,8 +5,28 @@ Simple server test to diagnose startup issues
 
 import sys
 import os
+import socket
 from pathlib import Path
 
+SERVER_PORTS = [8080, 8081, 8000]
+
+
+def port_is_free(port, host="127.0.0.1"):
+    """Cheap bind probe so uvicorn is only started on a port that is actually free"""
+    probe = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        # Match uvicorn's own bind options; on Windows SO_REUSEADDR would
+        # let the probe succeed on a port that is already in use
+        if sys.platform != "win32":
+            probe.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        probe.bind((host, port))
+        return True
+    except OSError:
+        return False
+    finally:
+        probe.close()
+
+
 print("🔍 AI Trading Bot - Server Diagnostic Test")
 print("=" * 50)
 
@@ -85,23 +105,17 @@ try:
     
     # Test 7: Try to start server
     print("\n7. Testing server startup...")
-    print("   Attempting to start server on port 8080...")
     
-    try:
-        import uvicorn
-        uvicorn.run(app, host="127.0.0.1", port=8080, log_level="info")
-    except Exception as e:
-        print(f"   ❌ Server startup failed: {e}")
-        print("   Trying alternative port 8081...")
+    # Probe the candidate ports first so uvicorn is started only once
+    port = next((p for p in SERVER_PORTS if port_is_free(p)), None)
+    if port is None:
+        print(f"   ❌ All ports failed: {SERVER_PORTS} are in use")
+    else:
+        print(f"   Attempting to start server on port {port}...")
         try:
-            uvicorn.run(app, host="127.0.0.1", port=8081, log_level="info")
-        except Exception as e2:
-            print(f"   ❌ Alternative port failed: {e2}")
-            print("   Trying port 8000...")
-            try:
-                uvicorn.run(app, host="127.0.0.1", port=8000, log_level="info")
-            except Exception as e3:
-                print(f"   ❌ All ports failed: {e3}")
+            uvicorn.run(app, host="127.0.0.1", port=port, log_level="info")
+        except Exception as e:
+            print(f"   ❌ Server startup failed: {e}")
                 
 except Exception as e:
     print(f"   ❌ FastAPI app creation failed: {e}")
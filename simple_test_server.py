@@ -7,7 +7,6 @@ print("🔄 Starting simple test server...")
 
 try:
     import http.server
-    import socketserver
     import os
     from pathlib import Path
     
@@ -23,13 +22,27 @@ try:
     PORT = 8000
     
     class MyHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
+        # Encoded once; send_header would format each line on every request
+        CORS_HEADERS = (
+            b"Access-Control-Allow-Origin: *\r\n"
+            b"Access-Control-Allow-Methods: GET, POST, OPTIONS\r\n"
+            b"Access-Control-Allow-Headers: *\r\n"
+        )
+        
         def end_headers(self):
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
-            self.send_header('Access-Control-Allow-Headers', '*')
+            # Added to the buffered header block, as send_header does, so
+            # the lines still follow the status line
+            if self.request_version != 'HTTP/0.9':
+                self._headers_buffer.append(self.CORS_HEADERS)
             super().end_headers()
+        
+        def copyfile(self, source, outputfile):
+            # Let the kernel copy the file to the socket (sendfile where the
+            # platform has it) instead of reading it through Python buffers
+            self.connection.sendfile(source)
     
-    with socketserver.TCPServer(("", PORT), MyHTTPRequestHandler) as httpd:
+    # One thread per connection, so a slow client does not stall the rest
+    with http.server.ThreadingHTTPServer(("", PORT), MyHTTPRequestHandler) as httpd:
         print(f"🚀 Server running at http://localhost:{PORT}")
         print(f"📊 Dashboard: http://localhost:{PORT}/index.html")
         print("Press Ctrl+C to stop")
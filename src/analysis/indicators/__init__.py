@@ -5,7 +5,7 @@ Provides a comprehensive set of technical indicators for market analysis.
 All indicators follow a consistent interface and support multiple timeframes.
 """
 
-from .base import IndicatorBase, IndicatorResult
+from .base import IndicatorBase, IndicatorResult, IndicatorType
 from .moving_averages import MovingAverageIndicator
 from .oscillators import RSIIndicator, StochasticIndicator, WilliamsRIndicator
 from .momentum import MACDIndicator, CCIIndicator
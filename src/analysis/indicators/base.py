@@ -198,3 +198,39 @@ class IndicatorBase(ABC):
             return np.array([(c.open + c.high + c.low + c.close) / 4 for c in candles])
         else:
             raise ValueError(f"Invalid price type: {price_type}")
+    
+    @staticmethod
+    def sma_series(prices: np.ndarray, period: int) -> np.ndarray:
+        """Simple moving average of a series, NaN for the first period - 1 values"""
+        result = np.full(len(prices), np.nan)
+        if len(prices) >= period:
+            result[period - 1:] = np.convolve(prices, np.ones(period) / period, mode="valid")
+        return result
+    
+    @staticmethod
+    def wma_series(prices: np.ndarray, period: int) -> np.ndarray:
+        """Linearly weighted moving average of a series, newest price weighted highest"""
+        result = np.full(len(prices), np.nan)
+        if len(prices) >= period:
+            weights = np.arange(period, 0, -1, dtype=float)
+            result[period - 1:] = np.convolve(prices, weights / weights.sum(), mode="valid")
+        return result
+    
+    @staticmethod
+    def ema_series(prices: np.ndarray, period: int, alpha: Optional[float] = None) -> np.ndarray:
+        """
+        Exponential moving average of a series, seeded with the SMA of the first period values
+        
+        Matches the recursive formula used by the streaming indicators. alpha
+        defaults to 2 / (period + 1); pass 1 / period for Wilder's smoothing.
+        """
+        result = np.full(len(prices), np.nan)
+        if len(prices) < period:
+            return result
+        
+        if alpha is None:
+            alpha = 2.0 / (period + 1)
+        
+        seeded = np.concatenate(([np.mean(prices[:period])], prices[period:]))
+        result[period - 1:] = pd.Series(seeded).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+        return result
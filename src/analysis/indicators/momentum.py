@@ -124,6 +124,27 @@ class MACDIndicator(IndicatorBase):
             self.logger.error(f"Error calculating MACD", e)
             return None
     
+    def compute(self, prices: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Calculate MACD, signal and histogram over a whole price series
+        
+        Both EMAs run over the full series and the signal line is an EMA of
+        the MACD line, i.e. the textbook definition.
+        """
+        prices = np.asarray(prices, dtype=float)
+        macd_line = self.ema_series(prices, self.fast_period) - self.ema_series(prices, self.slow_period)
+        
+        signal_line = np.full(len(prices), np.nan)
+        start = self.slow_period - 1
+        if len(prices) > start:
+            signal_line[start:] = self.ema_series(macd_line[start:], self.signal_period)
+        
+        return {
+            "macd": macd_line,
+            "signal": signal_line,
+            "histogram": macd_line - signal_line
+        }
+    
     def _calculate_signal_line(self) -> Optional[float]:
         """Calculate signal line (EMA of MACD values)"""
         if len(self.macd_values) < self.signal_period:
@@ -105,6 +105,20 @@ class MovingAverageIndicator(IndicatorBase):
             self.logger.error(f"Error calculating {self.name}", e)
             return None
     
+    def compute(self, prices: np.ndarray) -> np.ndarray:
+        """Calculate the moving average over a whole price series"""
+        prices = np.asarray(prices, dtype=float)
+        
+        if self.ma_type == "sma":
+            return self.sma_series(prices, self.period)
+        elif self.ma_type == "ema":
+            return self.ema_series(prices, self.period)
+        elif self.ma_type == "wma":
+            return self.wma_series(prices, self.period)
+        
+        # HMA as calculated by update(): 2 * WMA(n/2) - WMA(n)
+        return 2 * self.wma_series(prices, self.period // 2) - self.wma_series(prices, self.period)
+    
     def _calculate_sma(self, prices: np.ndarray) -> Optional[float]:
         """Calculate Simple Moving Average"""
         if len(prices) < self.period:
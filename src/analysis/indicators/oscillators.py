@@ -88,6 +88,25 @@ class RSIIndicator(IndicatorBase):
             self.logger.error(f"Error calculating RSI", e)
             return None
     
+    def compute(self, prices: np.ndarray) -> np.ndarray:
+        """Calculate RSI over a whole price series using Wilder's smoothing"""
+        prices = np.asarray(prices, dtype=float)
+        result = np.full(len(prices), np.nan)
+        if len(prices) < self.period + 1:
+            return result
+        
+        price_changes = np.diff(prices)
+        avg_gain = self.ema_series(np.where(price_changes > 0, price_changes, 0.0), self.period, self.alpha)
+        avg_loss = self.ema_series(np.where(price_changes < 0, -price_changes, 0.0), self.period, self.alpha)
+        
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rsi = 100 - (100 / (1 + avg_gain / avg_loss))
+        
+        # No losses in the window means RSI is pinned at 100
+        rsi[avg_loss == 0] = 100.0
+        result[1:] = rsi
+        return result
+    
     def _calculate_rsi(self, prices: np.ndarray) -> Optional[float]:
         """Calculate RSI using Wilder's smoothing method"""
         if len(prices) < self.period + 1:
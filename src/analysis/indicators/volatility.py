@@ -110,6 +110,28 @@ class BollingerBandsIndicator(IndicatorBase):
             self.logger.error(f"Error calculating Bollinger Bands", e)
             return None
     
+    def compute(self, prices: np.ndarray) -> Dict[str, np.ndarray]:
+        """Calculate upper/middle/lower bands, width and %B over a whole price series"""
+        prices = np.asarray(prices, dtype=float)
+        middle_band = self.ma_indicator.compute(prices)
+        
+        std_deviation = np.full(len(prices), np.nan)
+        if len(prices) >= self.period:
+            windows = np.lib.stride_tricks.sliding_window_view(prices, self.period)
+            std_deviation[self.period - 1:] = windows.std(axis=1)
+        
+        upper_band = middle_band + (self.std_dev * std_deviation)
+        lower_band = middle_band - (self.std_dev * std_deviation)
+        
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return {
+                "upper": upper_band,
+                "middle": middle_band,
+                "lower": lower_band,
+                "width": (upper_band - lower_band) / middle_band * 100,
+                "percent_b": (prices - lower_band) / (upper_band - lower_band)
+            }
+    
     def _generate_signal(self, price: float, upper_band: float, lower_band: float, percent_b: float) -> Optional[str]:
         """Generate trading signal based on Bollinger Bands"""
         # Price touches or exceeds upper band = potential sell signal
@@ -0,0 +1,112 @@
+"""
+Compiled candlestick pattern kernel
+
+Scans whole OHLC arrays for the patterns implemented by CandlestickPatterns
+in a single pass. Numba is optional: without it the kernel runs as plain
+Python over NumPy arrays and gives identical results, only slower.
+"""
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+# Column indices into the kernel output arrays
+DOJI = 0
+HAMMER = 1
+SHOOTING_STAR = 2
+SPINNING_TOP = 3
+BULLISH_ENGULFING = 4
+BEARISH_ENGULFING = 5
+BULLISH_HARAMI = 6
+BEARISH_HARAMI = 7
+PATTERN_COUNT = 8
+
+
+@njit(cache=True)
+def detect_candlestick_patterns(open_, high, low, close, confidence, ratio):
+    """
+    Detect candlestick patterns for every candle
+
+    Args:
+        open_, high, low, close: float64 price arrays of equal length
+        confidence: (n, PATTERN_COUNT) float64 output, 0.0 where no pattern
+        ratio: (n, PATTERN_COUNT) float64 output with the ratio each pattern reports
+    """
+    n = close.shape[0]
+
+    for i in range(n):
+        o = open_[i]
+        h = high[i]
+        l = low[i]
+        c = close[i]
+
+        # Same validity rules as PatternDetector.validate_candles
+        if o <= 0.0 or h <= 0.0 or l <= 0.0 or c <= 0.0:
+            continue
+        if not (l <= o <= h and l <= c <= h):
+            continue
+
+        body_low = min(o, c)
+        body_high = max(o, c)
+        body = body_high - body_low
+        upper = h - body_high
+        lower = body_low - l
+        total = h - l
+
+        # Single candlestick patterns
+        if total > 0.0:
+            body_ratio = body / total
+
+            if body_ratio <= 0.05:
+                confidence[i, DOJI] = 1.0 - body_ratio / 0.05
+                ratio[i, DOJI] = body_ratio
+
+            if body > 0.0:
+                upper_ratio = upper / body
+                lower_ratio = lower / body
+
+                if (body_low - l) / total >= 0.6 and lower_ratio >= 2.0 and upper_ratio <= 0.5:
+                    confidence[i, HAMMER] = min(lower_ratio / 3.0, 1.0)
+                    ratio[i, HAMMER] = lower_ratio
+
+                if (body_high - l) / total <= 0.4 and upper_ratio >= 2.0 and lower_ratio <= 0.5:
+                    confidence[i, SHOOTING_STAR] = min(upper_ratio / 3.0, 1.0)
+                    ratio[i, SHOOTING_STAR] = upper_ratio
+
+                if body_ratio <= 0.3 and upper_ratio >= 1.0 and lower_ratio >= 1.0:
+                    confidence[i, SPINNING_TOP] = 1.0 - body_ratio
+                    ratio[i, SPINNING_TOP] = body_ratio
+
+        # Two-candle patterns
+        if i == 0:
+            continue
+
+        po = open_[i - 1]
+        pc = close[i - 1]
+        prev_body = abs(pc - po)
+
+        if pc < po and c > o and o < pc and c > po:
+            size_ratio = body / prev_body if prev_body > 0.0 else 1.0
+            confidence[i, BULLISH_ENGULFING] = min(size_ratio / 2.0, 1.0)
+            ratio[i, BULLISH_ENGULFING] = size_ratio
+        elif pc > po and c < o and o > pc and c < po:
+            size_ratio = body / prev_body if prev_body > 0.0 else 1.0
+            confidence[i, BEARISH_ENGULFING] = min(size_ratio / 2.0, 1.0)
+            ratio[i, BEARISH_ENGULFING] = size_ratio
+
+        prev_low = min(po, pc)
+        prev_high = max(po, pc)
+        if o > prev_low and c < prev_high and o < prev_high and c > prev_low:
+            size_ratio = body / prev_body if prev_body > 0.0 else 0.0
+            column = BULLISH_HARAMI if pc < po else BEARISH_HARAMI
+            confidence[i, column] = 1.0 - size_ratio
+            ratio[i, column] = size_ratio
@@ -11,9 +11,23 @@ from typing import List, Optional, Dict, Any
 import numpy as np
 
 from .base import PatternDetector, PatternResult, PatternType, PatternSignal
+from . import _candlestick_numba as kernel
 from src.core.data_manager import Candle
 
 
+# Batch kernel column -> (pattern name, signal, candles spanned, ratio metadata key, description)
+BATCH_PATTERNS = {
+    kernel.DOJI: ("Doji", PatternSignal.NEUTRAL, 1, "body_ratio", "Indecision pattern - potential reversal"),
+    kernel.HAMMER: ("Hammer", PatternSignal.BULLISH, 1, "lower_shadow_ratio", "Bullish reversal pattern"),
+    kernel.SHOOTING_STAR: ("Shooting Star", PatternSignal.BEARISH, 1, "upper_shadow_ratio", "Bearish reversal pattern"),
+    kernel.SPINNING_TOP: ("Spinning Top", PatternSignal.NEUTRAL, 1, "body_ratio", "Indecision pattern"),
+    kernel.BULLISH_ENGULFING: ("Bullish Engulfing", PatternSignal.BULLISH, 2, "size_ratio", "Bullish reversal pattern"),
+    kernel.BEARISH_ENGULFING: ("Bearish Engulfing", PatternSignal.BEARISH, 2, "size_ratio", "Bearish reversal pattern"),
+    kernel.BULLISH_HARAMI: ("Bullish Harami", PatternSignal.BULLISH, 2, "size_ratio", "Potential reversal pattern"),
+    kernel.BEARISH_HARAMI: ("Bearish Harami", PatternSignal.BEARISH, 2, "size_ratio", "Potential reversal pattern"),
+}
+
+
 class CandlestickPatterns(PatternDetector):
     """Candlestick pattern detector"""
     
@@ -61,6 +75,78 @@ class CandlestickPatterns(PatternDetector):
         
         return patterns
     
+    def detect_batch(self, candles: List[Candle]) -> List[PatternResult]:
+        """
+        Detect patterns across a whole candle history in one compiled pass
+        
+        Gives the same patterns, confidences and ratios that feeding the
+        candles through update() would, filtered by min_confidence, without
+        touching the streaming state. Indices refer to positions in candles.
+        
+        Args:
+            candles: Candle history, oldest first
+            
+        Returns:
+            Detected patterns ordered by candle
+        """
+        count = len(candles)
+        if count == 0:
+            return []
+        
+        open_ = np.fromiter((c.open for c in candles), dtype=np.float64, count=count)
+        high = np.fromiter((c.high for c in candles), dtype=np.float64, count=count)
+        low = np.fromiter((c.low for c in candles), dtype=np.float64, count=count)
+        close = np.fromiter((c.close for c in candles), dtype=np.float64, count=count)
+        
+        confidence = np.zeros((count, kernel.PATTERN_COUNT))
+        ratio = np.zeros((count, kernel.PATTERN_COUNT))
+        kernel.detect_candlestick_patterns(open_, high, low, close, confidence, ratio)
+        
+        # Only the hits are turned into Python objects
+        patterns = []
+        hits = np.argwhere((confidence > 0.0) & (confidence >= self.min_confidence))
+        for index, column in hits.tolist():
+            patterns.append(self._batch_result(candles, index, column, confidence[index, column], ratio[index, column]))
+        
+        return patterns
+    
+    def _batch_result(self, candles: List[Candle], index: int, column: int, confidence: float, ratio: float) -> PatternResult:
+        """Package one kernel hit as a PatternResult"""
+        name, signal, span, ratio_key, description = BATCH_PATTERNS[column]
+        candle = candles[index]
+        
+        if column == kernel.DOJI:
+            key_levels = {"open": candle.open, "close": candle.close, "high": candle.high, "low": candle.low}
+        elif column == kernel.HAMMER:
+            key_levels = {"support": candle.low, "body_low": min(candle.open, candle.close), "body_high": max(candle.open, candle.close)}
+        elif column == kernel.SHOOTING_STAR:
+            key_levels = {"resistance": candle.high, "body_low": min(candle.open, candle.close), "body_high": max(candle.open, candle.close)}
+        elif column == kernel.SPINNING_TOP:
+            key_levels = {"high": candle.high, "low": candle.low, "body_mid": (candle.open + candle.close) / 2}
+        else:
+            prev_candle = candles[index - 1]
+            if column == kernel.BULLISH_ENGULFING:
+                key_levels = {"support": min(prev_candle.low, candle.low), "engulf_low": prev_candle.close, "engulf_high": prev_candle.open}
+            elif column == kernel.BEARISH_ENGULFING:
+                key_levels = {"resistance": max(prev_candle.high, candle.high), "engulf_low": prev_candle.open, "engulf_high": prev_candle.close}
+            else:
+                key_levels = {"outer_high": prev_candle.high, "outer_low": prev_candle.low, "inner_high": candle.high, "inner_low": candle.low}
+        
+        return PatternResult(
+            pattern_name=name,
+            pattern_type=PatternType.CANDLESTICK,
+            signal=signal,
+            confidence=float(confidence),
+            timestamp=candle.timestamp,
+            start_index=index - span + 1,
+            end_index=index,
+            key_levels=key_levels,
+            metadata={
+                ratio_key: float(ratio),
+                "description": description
+            }
+        )
+    
     def _detect_single_patterns(self, candles: List[Candle]) -> List[PatternResult]:
         """Detect single candlestick patterns"""
         patterns = []
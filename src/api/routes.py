@@ -3,10 +3,13 @@ API routes for the trading bot
 """
 
 import uuid
-from fastapi import APIRouter, HTTPException, Depends
-from typing import List, Optional
+from fastapi import APIRouter, HTTPException, Depends, Request
+from fastapi.routing import APIRoute
+from typing import Any, Callable, List, Optional
 from datetime import datetime, timedelta
 
+import orjson
+
 from src.core.config import get_settings
 from src.core.memory_storage import get_memory_data_manager
 from src.api.models import (
@@ -21,14 +24,38 @@ from src.api.models import (
     RiskMetricsResponse
 )
 
+
+class ORJSONRequest(Request):
+    """Request whose JSON body is decoded with orjson"""
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError, so
+            # FastAPI still turns malformed bodies into a 422
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class ORJSONRoute(APIRoute):
+    """APIRoute that parses request bodies through ORJSONRequest"""
+
+    def get_route_handler(self) -> Callable:
+        route_handler = super().get_route_handler()
+
+        async def orjson_route_handler(request: Request):
+            return await route_handler(ORJSONRequest(request.scope, request.receive))
+
+        return orjson_route_handler
+
+
 # Create main API router
-api_router = APIRouter()
+api_router = APIRouter(route_class=ORJSONRoute)
 
 # Trading endpoints
-trading_router = APIRouter(prefix="/trading", tags=["trading"])
-strategies_router = APIRouter(prefix="/strategies", tags=["strategies"])
-data_router = APIRouter(prefix="/data", tags=["data"])
-analytics_router = APIRouter(prefix="/analytics", tags=["analytics"])
+trading_router = APIRouter(prefix="/trading", tags=["trading"], route_class=ORJSONRoute)
+strategies_router = APIRouter(prefix="/strategies", tags=["strategies"], route_class=ORJSONRoute)
+data_router = APIRouter(prefix="/data", tags=["data"], route_class=ORJSONRoute)
+analytics_router = APIRouter(prefix="/analytics", tags=["analytics"], route_class=ORJSONRoute)
 
 
 @trading_router.get("/status")
@@ -375,7 +402,7 @@ async def get_system_status():
 
 
 # Bot Control Endpoints
-bot_control_router = APIRouter(prefix="/bot", tags=["bot-control"])
+bot_control_router = APIRouter(prefix="/bot", tags=["bot-control"], route_class=ORJSONRoute)
 
 # Global bot state
 bot_state = {
@@ -20,6 +20,7 @@ class DatabaseConfig(BaseModel):
     password: str = "trading_pass"
     pool_size: int = 10
     max_overflow: int = 20
+    statement_cache_size: int = 256
 
 
 class InfluxDBConfig(BaseModel):
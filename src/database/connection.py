@@ -62,6 +62,11 @@ class DatabaseManager:
                 pool_pre_ping=True,  # Validate connections before use
                 pool_recycle=3600,   # Recycle connections every hour
                 echo=self.settings.app.debug,  # Log SQL queries in debug mode
+                # Prepared statements kept per connection, so repeated queries
+                # skip PostgreSQL's parse and plan
+                connect_args={
+                    "prepared_statement_cache_size": self.db_config.statement_cache_size
+                },
             )
 
             # Create session factory
@@ -74,9 +74,12 @@ class BinanceExchange(BaseExchange):
             True if connection successful
         """
         try:
-            # Create HTTP session with timeout
+            # Create HTTP session with timeout. Idle connections are kept
+            # alive and DNS answers cached, so requests after the first reuse
+            # an open TLS connection instead of handshaking again
             timeout = aiohttp.ClientTimeout(total=30, connect=10)
-            self.session = aiohttp.ClientSession(timeout=timeout)
+            connector = aiohttp.TCPConnector(limit=100, ttl_dns_cache=300, keepalive_timeout=60)
+            self.session = aiohttp.ClientSession(timeout=timeout, connector=connector)
 
             # Test connectivity
             await self._test_connectivity()
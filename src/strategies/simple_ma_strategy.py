@@ -5,6 +5,7 @@ Simple Moving Average Strategy - Basic implementation for testing
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from collections import deque
+from itertools import islice
 
 from src.core.strategy_manager import BaseStrategy
 from src.core.config import Settings
@@ -26,6 +27,9 @@ class SimpleMAStrategy(BaseStrategy):
 
         # Data storage
         self.candles: deque = deque(maxlen=self.slow_period + 10)
+        # Close prices for the longest MA window, kept apart from the candles
+        # so each MA sums floats in place instead of copying Candle objects
+        self.closes: deque = deque(maxlen=max(self.fast_period, self.slow_period))
         self.fast_ma_values: deque = deque(maxlen=100)
         self.slow_ma_values: deque = deque(maxlen=100)
 
@@ -71,6 +75,7 @@ class SimpleMAStrategy(BaseStrategy):
 
             # Add candle to our data
             self.candles.append(candle)
+            self.closes.append(candle.close)
 
             # Need enough data for calculation
             if len(self.candles) < self.slow_period:
@@ -112,11 +117,8 @@ class SimpleMAStrategy(BaseStrategy):
         if len(self.candles) < period:
             return None
 
-        # Get last 'period' candles
-        recent_candles = list(self.candles)[-period:]
-
-        # Calculate average of close prices
-        total = sum(candle.close for candle in recent_candles)
+        # Average of the last 'period' close prices
+        total = sum(islice(self.closes, len(self.closes) - period, None))
         return total / period
 
     def _generate_signal(self, fast_ma: float, slow_ma: float) -> Optional[Dict[str, Any]]:
@@ -183,6 +185,7 @@ class SimpleMAStrategy(BaseStrategy):
         try:
             # Clear data structures
             self.candles.clear()
+            self.closes.clear()
             self.fast_ma_values.clear()
             self.slow_ma_values.clear()
 
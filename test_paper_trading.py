@@ -263,7 +263,7 @@ async def test_performance_tracking():
 
 
 async def main():
-    """Main test function"""
+    """Main test function, returning whether the workflow tests passed"""
     print("🧪 Paper Trading Integration Tests")
     print("=" * 50)
     
@@ -288,6 +288,8 @@ async def main():
         print("\n❌ Paper trading tests failed")
         print("   Please check database setup and try again")
 
+    return workflow_ok
+
 
 if __name__ == "__main__":
     asyncio.run(main())
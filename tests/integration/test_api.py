@@ -63,3 +63,26 @@ def test_performance_endpoint(client: TestClient):
     data = response.json()
     assert "total_return" in data
     assert "sharpe_ratio" in data
+
+
+def test_place_order_endpoint(client: TestClient):
+    """Test order placement parses the JSON body"""
+    response = client.post(
+        "/api/v1/trading/orders",
+        json={"symbol": "BTCUSDT", "side": "buy", "quantity": 0.01},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["symbol"] == "BTCUSDT"
+    assert data["quantity"] == 0.01
+
+
+def test_place_order_malformed_json(client: TestClient):
+    """Test malformed order bodies are rejected as validation errors"""
+    response = client.post(
+        "/api/v1/trading/orders",
+        content=b'{"symbol": "BTCUSDT",',
+        headers={"content-type": "application/json"},
+    )
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["type"] == "json_invalid"
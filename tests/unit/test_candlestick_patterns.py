@@ -0,0 +1,99 @@
+"""
+Unit tests for candlestick pattern recognition
+
+Checks the compiled batch detector against the streaming update() path.
+"""
+
+import pytest
+from datetime import datetime, timedelta
+from typing import List
+import numpy as np
+
+from src.core.data_manager import Candle
+from src.analysis.patterns import CandlestickPatterns
+from src.analysis.patterns.base import PatternSignal
+
+
+def make_candle(index: int, open_price: float, high: float, low: float, close: float) -> Candle:
+    """Build a test candle at a fixed minute offset"""
+    return Candle(
+        symbol="TESTUSDT",
+        timeframe="1m",
+        timestamp=datetime(2024, 1, 1) + timedelta(minutes=index),
+        open_price=open_price,
+        high_price=high,
+        low_price=low,
+        close_price=close,
+        volume=1000.0
+    )
+
+
+def random_candles(count: int, seed: int) -> List[Candle]:
+    """Random walk candles with wicks on both sides"""
+    rng = np.random.default_rng(seed)
+    candles = []
+    price = 100.0
+    
+    for i in range(count):
+        close = price * (1 + rng.normal(0, 0.01))
+        high = max(price, close) * (1 + abs(rng.normal(0, 0.005)))
+        low = min(price, close) * (1 - abs(rng.normal(0, 0.005)))
+        candles.append(make_candle(i, price, high, low, close))
+        price = close
+    
+    return candles
+
+
+def pattern_key(pattern):
+    """Comparable summary of a detected pattern"""
+    return (
+        pattern.end_index,
+        pattern.start_index,
+        pattern.pattern_name,
+        round(pattern.confidence, 9),
+        tuple(sorted(pattern.key_levels.items()))
+    )
+
+
+class TestCandlestickBatch:
+    """Test CandlestickPatterns.detect_batch"""
+    
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_batch_matches_update(self, seed):
+        """Batch detection finds exactly what streaming detection finds"""
+        candles = random_candles(200, seed)
+        
+        streaming = CandlestickPatterns(min_confidence=0.3)
+        streamed = []
+        for candle in candles:
+            streamed.extend(streaming.update(candle))
+        
+        batch = CandlestickPatterns(min_confidence=0.3).detect_batch(candles)
+        
+        assert len(streamed) > 0
+        assert sorted(map(pattern_key, streamed)) == sorted(map(pattern_key, batch))
+    
+    def test_bullish_engulfing(self):
+        """A bearish candle swallowed by a bullish one is flagged"""
+        candles = [
+            make_candle(0, 102.0, 102.5, 99.5, 100.0),
+            make_candle(1, 99.0, 104.5, 98.5, 104.0),
+        ]
+        
+        patterns = CandlestickPatterns().detect_batch(candles)
+        engulfing = [p for p in patterns if p.pattern_name == "Bullish Engulfing"]
+        
+        assert len(engulfing) == 1
+        assert engulfing[0].signal == PatternSignal.BULLISH
+        assert engulfing[0].start_index == 0
+        assert engulfing[0].end_index == 1
+    
+    def test_invalid_candles_are_skipped(self):
+        """Candles with inconsistent OHLC produce no patterns"""
+        candles = [make_candle(0, 100.0, 99.0, 101.0, 100.0)]
+        
+        assert CandlestickPatterns().detect_batch(candles) == []
+    
+    def test_empty_history(self):
+        """An empty history yields no patterns"""
+        assert CandlestickPatterns().detect_batch([]) == []
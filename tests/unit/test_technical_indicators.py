@@ -387,5 +387,112 @@ class TestIndicatorIntegration:
                 assert isinstance(macd_result.value, dict)
 
 
+class TestBatchCompute:
+    """Test vectorized compute() against the streaming update() path"""
+    
+    @staticmethod
+    def stream_values(indicator, candles: List[Candle]) -> np.ndarray:
+        """Feed candles one at a time and collect values aligned with the input"""
+        values = []
+        for candle in candles:
+            result = indicator.update(candle)
+            values.append(result.value if result else np.nan)
+        return np.array(values, dtype=float)
+    
+    @pytest.mark.parametrize("ma_type", ["sma", "ema", "wma", "hma"])
+    def test_moving_average_matches_update(self, ma_type):
+        """Batch moving averages match the streaming values"""
+        candles = TestIndicatorHelpers.create_test_candles(40)
+        prices = np.array([c.close for c in candles])
+        
+        streamed = self.stream_values(MovingAverageIndicator(period=10, ma_type=ma_type), candles)
+        batch = MovingAverageIndicator(period=10, ma_type=ma_type).compute(prices)
+        
+        assert np.allclose(streamed, batch, equal_nan=True)
+    
+    def test_rsi_matches_update(self):
+        """Batch RSI matches the streaming Wilder-smoothed values"""
+        candles = TestIndicatorHelpers.create_test_candles(40)
+        prices = np.array([c.close for c in candles])
+        
+        streamed = self.stream_values(RSIIndicator(period=14), candles)
+        batch = RSIIndicator(period=14).compute(prices)
+        
+        assert np.allclose(streamed, batch, equal_nan=True)
+    
+    def test_rsi_flat_prices(self):
+        """Batch RSI handles zero losses without dividing by zero"""
+        batch = RSIIndicator(period=5).compute(np.full(10, 100.0))
+        
+        assert np.isnan(batch[:5]).all()
+        assert (batch[5:] == 100.0).all()
+    
+    def test_bollinger_bands_compute(self):
+        """Batch Bollinger Bands use the SMA and population std of each window"""
+        prices = np.array([c.close for c in TestIndicatorHelpers.create_test_candles(30)])
+        bands = BollingerBandsIndicator(period=20, std_dev=2.0).compute(prices)
+        
+        window = prices[-20:]
+        assert abs(bands["middle"][-1] - window.mean()) < 1e-9
+        assert abs(bands["upper"][-1] - (window.mean() + 2 * window.std())) < 1e-9
+        assert np.isnan(bands["middle"][:19]).all()
+    
+    @staticmethod
+    def reference_ema(values: np.ndarray, period: int) -> np.ndarray:
+        """Textbook recursive EMA seeded with the SMA of the first period values"""
+        alpha = 2.0 / (period + 1)
+        result = [np.nan] * (period - 1)
+        ema = sum(values[:period]) / period
+        result.append(ema)
+        for value in values[period:]:
+            ema = alpha * value + (1 - alpha) * ema
+            result.append(ema)
+        return np.array(result)
+    
+    def test_macd_compute(self):
+        """Batch MACD matches a hand-rolled textbook EMA reference"""
+        prices = np.array([c.close for c in TestIndicatorHelpers.create_test_candles(60)])
+        macd = MACDIndicator(fast_period=12, slow_period=26, signal_period=9).compute(prices)
+        
+        expected_macd = self.reference_ema(prices, 12) - self.reference_ema(prices, 26)
+        expected_signal = np.full(len(prices), np.nan)
+        expected_signal[25:] = self.reference_ema(expected_macd[25:], 9)
+        
+        assert np.allclose(macd["macd"], expected_macd, equal_nan=True)
+        assert np.allclose(macd["signal"], expected_signal, equal_nan=True)
+        assert np.allclose(macd["histogram"], expected_macd - expected_signal, equal_nan=True)
+        assert np.isnan(macd["signal"][:33]).all()
+        assert not np.isnan(macd["histogram"][33:]).any()
+    
+    def test_macd_update_lags_compute(self):
+        """Streaming MACD only starts its EMAs once the slow warm-up window is full"""
+        candles = TestIndicatorHelpers.create_test_candles(80)
+        prices = np.array([c.close for c in candles])
+        indicator = MACDIndicator(fast_period=12, slow_period=26, signal_period=9)
+        
+        streamed = np.array([
+            result.value["macd"] if result else np.nan
+            for result in (indicator.update(candle) for candle in candles)
+        ])
+        
+        # The streaming EMAs see their first candle at index slow_period - 1,
+        # so update() equals compute() run on the series from that point on
+        lagged = np.full(len(prices), np.nan)
+        lagged[25:] = MACDIndicator(fast_period=12, slow_period=26, signal_period=9).compute(prices[25:])["macd"]
+        assert np.allclose(streamed, lagged, equal_nan=True)
+        
+        # ...and so first reports a value 25 candles after compute() does
+        full = MACDIndicator(fast_period=12, slow_period=26, signal_period=9).compute(prices)["macd"]
+        assert np.isnan(streamed[:50]).all() and not np.isnan(streamed[50])
+        assert np.isnan(full[:25]).all() and not np.isnan(full[25])
+    
+    def test_compute_with_insufficient_data(self):
+        """Batch computation returns all-NaN output for short series"""
+        prices = np.array([100.0, 101.0, 102.0])
+        
+        assert np.isnan(MovingAverageIndicator(period=5).compute(prices)).all()
+        assert np.isnan(RSIIndicator(period=14).compute(prices)).all()
+
+
 if __name__ == "__main__":
     pytest.main([__file__])